@@ -1,51 +1,15 @@
 # pyright: reportAttributeAccessIssue=none
 
-from typing import Annotated, Any
+from typing import Annotated
 
-import msgspec
-from msgspec import Struct, ValidationError
+from msgspec import Struct
 
 from mini_framework import Application
 from mini_framework.params import Query
-from mini_framework.responses import Response
-from mini_framework.serialization_preparer.base import SerializationPreparer
-from mini_framework.validators.base import Validator
-from mini_framework.exceptions import (
-    RequestValidationError,
-    ResponseValidationError,
+from mini_framework.serialization_preparer.msgspec import (
+    MsgspecSerializationPreparer,
 )
-
-
-class MsgspecValidator(Validator):
-    def validate_request(self, params: dict[str, Any], model: type, /) -> Any:
-        try:
-            return msgspec.convert(params, model, strict=False)
-        except ValidationError as e:
-            raise RequestValidationError(
-                str(e), params=params, expected_type=model
-            )
-
-    def validate_response(self, obj: Any, return_type: type, /) -> Any:
-        if return_type is Any:
-            return obj
-
-        if isinstance(obj, Response):
-            content = obj.content
-        else:
-            content = obj
-
-        try:
-            return msgspec.convert(content, return_type, strict=False)
-        except ValidationError as e:
-            raise ResponseValidationError(
-                str(e), value=obj, expected_type=return_type
-            )
-
-
-class MsgspecSerializationPreparer(SerializationPreparer):
-    def prepare_response(self, obj: Any, return_type: type, /) -> Any:
-        return msgspec.to_builtins(obj)
-
+from mini_framework.validators.msgspec import MsgspecValidator
 
 app = Application(
     validator=MsgspecValidator(),
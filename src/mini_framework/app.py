@@ -1,4 +1,6 @@
 import json
+import time
+from collections import ChainMap
 from collections.abc import Iterable, Callable
 from typing import Any
 from wsgiref.types import StartResponse, WSGIEnvironment
@@ -9,11 +11,7 @@ from mini_framework.serialization_preparer.pydantic import (
 )
 from mini_framework.validators.base import Validator
 from mini_framework.middlewares.errors import ErrorsMiddleware
-from mini_framework.request import (
-    extract_path_params,
-    Request,
-    ensure_trailing_slash,
-)
+from mini_framework.request import Request, ensure_trailing_slash
 from mini_framework.responses import (
     get_status_code_and_phrase,
     prepare_headers,
@@ -21,10 +19,14 @@ from mini_framework.responses import (
     StreamingResponse,
     FileResponse,
     JSONResponse,
+    PreparedResponse,
+    ResponseStrategy,
 )
 from mini_framework.router import Router, NOT_FOUND_RESPONSE
 from mini_framework.routes.manager import UNHANDLED
-from mini_framework.routes.route import Route
+from mini_framework.routes.plan import RoutePlan, RouteScope
+from mini_framework.routes.route import validate_response_validation_rate
+from mini_framework.routes.tree import RouteTree
 from mini_framework.validators.pydantic import PydanticValidator
 
 
@@ -34,6 +36,9 @@ class Application(Router):
         "_validator",
         "_serialization_preparer",
         "_json_loads",
+        "_json_dumps",
+        "_response_validation_rate",
+        "_route_tree",
     )
 
     def __init__(
@@ -45,6 +50,8 @@ class Application(Router):
         validator: Validator = PydanticValidator(),
         serialization_preparer: SerializationPreparer = PydanticSerializationPreparer(),
         json_loads: Callable[..., Any] = json.loads,
+        json_dumps: Callable[[Any], bytes | str] | None = None,
+        response_validation_rate: float = 1,
         **kwargs: Any,
     ) -> None:
         super().__init__(
@@ -56,6 +63,10 @@ class Application(Router):
         self._validator = validator
         self._serialization_preparer = serialization_preparer
         self._json_loads = json_loads
+        self._json_dumps = json_dumps
+        validate_response_validation_rate(response_validation_rate)
+        self._response_validation_rate = response_validation_rate
+        self._route_tree: RouteTree | None = None
 
         self.route.outer_middleware.register(ErrorsMiddleware())
 
@@ -76,30 +87,39 @@ class Application(Router):
     def parent_router(self, router: Router) -> None:
         raise RuntimeError("Application can not be attached to another Router")
 
+    def _invalidate(self) -> None:
+        self._route_tree = None
+
     def __call__(
         self, environ: WSGIEnvironment, start_response: StartResponse
     ) -> Iterable[bytes]:
         path = ensure_trailing_slash(environ["PATH_INFO"])
 
-        path_template: str | None = self._get_path_template(path)
+        match = self.route_tree.lookup(environ["REQUEST_METHOD"], path)
 
-        if path_template is None:
-            response = NOT_FOUND_RESPONSE
+        if match is None:
+            response = (
+                self.route_tree.method_not_allowed_response(path)
+                or NOT_FOUND_RESPONSE
+            )
         else:
-            path_params = extract_path_params(path_template, path)
-
             request = Request(
                 self,
                 environ,
-                path_params=path_params,
+                path=path,
+                path_params=match.path_params,
                 json_loads=self._json_loads,
             )
 
-            response = self.propagate(request)
+            response = self._propagate(request, match.candidates)
 
             if response is UNHANDLED:
                 response = NOT_FOUND_RESPONSE
 
+        if isinstance(response, PreparedResponse):
+            start_response(response.status_line, response.raw_headers)
+            return (response.body,)
+
         status = get_status_code_and_phrase(response.status_code)
         body = response.render()
         headers = prepare_headers(response, body)
@@ -107,82 +127,100 @@ class Application(Router):
         if isinstance(response, StreamingResponse):
             return response.body_iterator
         elif isinstance(response, FileResponse):
-            return response.iter_content()
+            return response.iter_wsgi(environ)
         return (body,)
 
-    def _get_path_template(self, path: str) -> str | None:
+    @property
+    def route_tree(self) -> RouteTree:
+        if self._route_tree is None:
+            self.compile()
+        return self._route_tree  # pyright: ignore[reportReturnType]
+
+    def compile(self) -> None:
+        outer_middlewares = tuple(self.route.outer_middleware)
+        self._route_tree = RouteTree(
+            router.route.compile(
+                route,
+                outer_middlewares=outer_middlewares,
+                validator=self._validator,
+                serialization_preparer=self._serialization_preparer,
+                response_validation_rate=self._response_validation_rate,
+            )
+            for router in self.chain_tail
+            for route in router.route
+        )
+
+    def warm_up(self) -> float:
+        start = time.perf_counter()
+        self.compile()
+        types: list[Any] = []
         for router in self.chain_tail:
             for route in router.route:
-                if route.path == path:
-                    return route.path
-                try:
-                    path_params = extract_path_params(route.path, path)
-                except ValueError:
-                    continue
-                if path_params:
-                    return route.path
-        return None
+                types.append(route.model)
+                if route.body_model_param is not None:
+                    types.append(route.body_models[route.body_model_param])
+                if route.response_strategy is ResponseStrategy.MODEL:
+                    types.append(route.response_type)
+        self._validator.warm_up(types)
+        return time.perf_counter() - start
 
     def propagate(self, request: Request, /, **kwargs: Any) -> Response:
-        for router, route in self._get_matching_routers_and_routes(request):
-            if route.response_class is None:
-                response_obj = router.default_response_class(
-                    content=None, status_code=route.status_code
-                )
-            else:
-                response_obj = route.response_class(
-                    content=None, status_code=route.status_code
-                )
-
-            response = self.route.wrap_outer_middleware(
-                router.route.trigger,
-                {
-                    **self._workflow_data,
-                    **kwargs,
-                    "app": self,
-                    "router": router,
-                    "route": route,
-                    "request": request,
-                    "response": response_obj,
-                    "validator": self._validator,
-                    "serialization_preparer": self._serialization_preparer,
-                },
+        match = self.route_tree.lookup(request.method, request.path)
+        if match is None:
+            return UNHANDLED
+        return self._propagate(request, match.candidates, **kwargs)
+
+    def _propagate(
+        self,
+        request: Request,
+        candidates: Iterable[RoutePlan],
+        /,
+        **kwargs: Any,
+    ) -> Response:
+        request_scope = {
+            **kwargs,
+            "app": self,
+            "request": request,
+            "validator": self._validator,
+            "serialization_preparer": self._serialization_preparer,
+        }
+
+        for plan in candidates:
+            route_scope = RouteScope(plan)
+
+            response = plan.outer_chain(
+                ChainMap(route_scope, request_scope, self._workflow_data),
             )
 
             if response is UNHANDLED:
                 continue
 
             if not isinstance(response, Response):
+                response_obj = route_scope["response"]
                 response_obj.content = response
-                return response_obj
+                response = response_obj
+
+            if (
+                isinstance(response, JSONResponse)
+                and response.json_dumps is None
+            ):
+                response.json_dumps = self._json_dumps
 
             return response
 
         return UNHANDLED
 
-    def _get_matching_routers_and_routes(
-        self,
-        request: Request,
-        /,  # noqa: W504
-    ) -> Iterable[tuple[Router, Route]]:
-        for router in self.chain_tail:
-            for route in router.route:
-                if route.match(request):
-                    yield router, route
-
     def propagate_error(
         self, exception: Exception, /, **kwargs: Any
     ) -> Response:
         for router in self.chain_tail:
             response = self.error.wrap_outer_middleware(
                 router.error.trigger,
-                {
-                    **self._workflow_data,
-                    **kwargs,
-                    "app": self,
-                    "router": router,
-                    "exception": exception,
-                },
+                ChainMap(
+                    {"app": self, "router": router, "exception": exception},
+                    kwargs,
+                    self._workflow_data,
+                ),
             )
             if response is not UNHANDLED:
                 return response
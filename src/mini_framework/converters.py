@@ -0,0 +1,69 @@
+import builtins
+import re
+import uuid
+from typing import Any, ClassVar
+
+
+class Converter:
+    __slots__ = ()
+
+    regex: ClassVar[re.Pattern[str]]
+    python_type: ClassVar[builtins.type] = str
+
+    def convert(self, value: str) -> Any:
+        if not self.regex.fullmatch(value):
+            raise ValueError(f"Invalid value: {value!r}")
+        return value
+
+
+class StringConverter(Converter):
+    __slots__ = ()
+
+    regex = re.compile(r"[^/]+")
+
+
+class PathConverter(Converter):
+    __slots__ = ()
+
+    regex = re.compile(r".+")
+
+
+class IntegerConverter(Converter):
+    __slots__ = ()
+
+    regex = re.compile(r"[0-9]+")
+    python_type = int
+
+    def convert(self, value: str) -> int:
+        return int(super().convert(value))
+
+
+class FloatConverter(Converter):
+    __slots__ = ()
+
+    regex = re.compile(r"[0-9]+(\.[0-9]+)?")
+    python_type = float
+
+    def convert(self, value: str) -> float:
+        return float(super().convert(value))
+
+
+class UUIDConverter(Converter):
+    __slots__ = ()
+
+    regex = re.compile(
+        r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+    )
+    python_type = uuid.UUID
+
+    def convert(self, value: str) -> uuid.UUID:
+        return uuid.UUID(super().convert(value))
+
+
+CONVERTERS: dict[str, Converter] = {
+    "str": StringConverter(),
+    "path": PathConverter(),
+    "int": IntegerConverter(),
+    "float": FloatConverter(),
+    "uuid": UUIDConverter(),
+}
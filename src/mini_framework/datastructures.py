@@ -1,5 +1,6 @@
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
 from dataclasses import dataclass, field
-from typing import BinaryIO
+from typing import Any, BinaryIO
 
 try:
     from multipart.multipart import Field, File
@@ -17,6 +18,35 @@ class Address:
 class FormData:
     fields: list["Field"]
     files: list["File"]
+    _fields_by_name: dict[str, list["Field"]] = field(
+        init=False, repr=False, compare=False
+    )
+    _files_by_name: dict[str, list["File"]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        fields_by_name: dict[str, list["Field"]] = {}
+        for form_field in self.fields:
+            fields_by_name.setdefault(
+                form_field.field_name.decode(), []
+            ).append(form_field)
+
+        files_by_name: dict[str, list["File"]] = {}
+        for file in self.files:
+            if file.field_name is not None:
+                files_by_name.setdefault(file.field_name.decode(), []).append(
+                    file
+                )
+
+        object.__setattr__(self, "_fields_by_name", fields_by_name)
+        object.__setattr__(self, "_files_by_name", files_by_name)
+
+    def get_fields(self, name: str) -> list["Field"]:
+        return self._fields_by_name.get(name, [])
+
+    def get_files(self, name: str) -> list["File"]:
+        return self._files_by_name.get(name, [])
 
 
 @dataclass(frozen=True, slots=True)
@@ -24,3 +54,88 @@ class UploadFile:
     file: BinaryIO
     size: int | None = field(default=None, kw_only=True)
     filename: str | None = field(default=None, kw_only=True)
+
+
+class ResponseHeaders(MutableMapping[str, str]):
+    __slots__ = ("raw",)
+
+    def __init__(
+        self,
+        headers: Mapping[str, str] | Iterable[tuple[str, str]] | None = None,
+    ) -> None:
+        # Headers are kept in the form they are sent in, names are only
+        # compared case-insensitively when they are looked up
+        if headers is None:
+            self.raw: list[tuple[str, str]] = []
+        elif isinstance(headers, Mapping):
+            self.raw = list(headers.items())
+        else:
+            self.raw = list(headers)
+
+    def __getitem__(self, key: str) -> str:
+        lowered = key.lower()
+        for name, value in self.raw:
+            if name.lower() == lowered:
+                return value
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: str) -> None:
+        lowered = key.lower()
+        raw: list[tuple[str, str]] = []
+        found = False
+        for name, old_value in self.raw:
+            if name.lower() != lowered:
+                raw.append((name, old_value))
+            elif not found:
+                raw.append((key, value))
+                found = True
+        if not found:
+            raw.append((key, value))
+        self.raw[:] = raw
+
+    def __delitem__(self, key: str) -> None:
+        lowered = key.lower()
+        raw = [item for item in self.raw if item[0].lower() != lowered]
+        if len(raw) == len(self.raw):
+            raise KeyError(key)
+        self.raw[:] = raw
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        lowered = key.lower()
+        return any(name.lower() == lowered for name, _ in self.raw)
+
+    def __iter__(self) -> Iterator[str]:
+        return (name for name, _ in self.raw)
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"{type(self).__name__}({self.raw!r})"
+
+    def add(self, key: str, value: str) -> None:
+        self.raw.append((key, value))
+
+    def getall(self, key: str, default: Any = ...) -> list[str]:
+        lowered = key.lower()
+        values = [value for name, value in self.raw if name.lower() == lowered]
+        if not values:
+            if default is ...:
+                raise KeyError(key)
+            return default
+        return values
+
+    def setdefault(self, key: str, default: str) -> str:  # pyright: ignore[reportIncompatibleMethodOverride]
+        try:
+            return self[key]
+        except KeyError:
+            self.raw.append((key, default))
+            return default
+
+    def items(self) -> list[tuple[str, str]]:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return list(self.raw)
+
+    def values(self) -> list[str]:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return [value for _, value in self.raw]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterator, MutableMapping
 from typing import Any, TYPE_CHECKING
 
 from mini_framework.errors.handlers import (
@@ -10,7 +10,10 @@ from mini_framework.errors.handlers import (
 from mini_framework.exceptions import HTTPException, RequestValidationError
 from mini_framework.filters.exception import ExceptionTypeFilter
 from mini_framework.middlewares.base import Middleware
-from mini_framework.middlewares.manager import MiddlewareManager
+from mini_framework.middlewares.manager import (
+    MiddlewareManager,
+    chain_middlewares,
+)
 from mini_framework.routes.manager import SkipRoute, UNHANDLED
 from mini_framework.routes.route import (
     CallableObject,
@@ -62,12 +65,9 @@ class ErrorsManager:
         return iter(self._handlers)
 
     def wrap_outer_middleware(
-        self, callback: Any, data: dict[str, Any]
+        self, callback: Any, data: MutableMapping[str, Any]
     ) -> Any:
-        wrapped_outer = self.outer_middleware.wrap_middlewares(
-            self.outer_middleware,
-            callback,
-        )
+        wrapped_outer = chain_middlewares(self.outer_middleware, callback)
         return wrapped_outer(data)
 
     def filter(self, *filters: CallbackType) -> None:
@@ -75,17 +75,13 @@ class ErrorsManager:
             [CallableObject(callback=filter) for filter in filters]
         )
 
-    def check_root_filters(
-        self, kwargs: dict[str, Any]
-    ) -> tuple[bool, dict[str, Any]]:
-        return self._handler.check(**kwargs)
+    def check_root_filters(self, data: MutableMapping[str, Any], /) -> bool:
+        return self._handler.check(data)
 
-    def trigger(self, **kwargs: Any) -> Any:
+    def trigger(self, data: MutableMapping[str, Any], /) -> Any:
         for head_router in reversed(tuple(self._router.chain_head)):
-            result, data = head_router.error.check_root_filters(kwargs)
-            if not result:
+            if not head_router.error.check_root_filters(data):
                 return UNHANDLED
-            kwargs.update(data)
 
         errors = self._handlers + [
             self._http_exception_error,
@@ -93,17 +89,15 @@ class ErrorsManager:
         ]
 
         for error in errors:
-            kwargs["error"] = error
-            result, data = error.check(**kwargs)
+            data["error"] = error
 
-            if result:
-                kwargs.update(data)
+            if error.check(data):
                 try:
-                    wrapped_inner = self.middleware.wrap_middlewares(
+                    wrapped_inner = chain_middlewares(
                         self._resolve_middlewares(),  # noqa: B038
-                        error.call,
+                        error.call_with,
                     )
-                    return wrapped_inner(kwargs)
+                    return wrapped_inner(data)
                 except SkipRoute:
                     continue
 
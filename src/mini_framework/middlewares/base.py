@@ -1,9 +1,9 @@
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, MutableMapping
 from typing import Any, TypeAlias
 
-CallNext: TypeAlias = Callable[[dict[str, Any]], Any]
-Middleware: TypeAlias = Callable[[CallNext, dict[str, Any]], Any]
+CallNext: TypeAlias = Callable[[MutableMapping[str, Any]], Any]
+Middleware: TypeAlias = Callable[[CallNext, MutableMapping[str, Any]], Any]
 
 
 class BaseMiddleware(ABC):
@@ -11,6 +11,6 @@ class BaseMiddleware(ABC):
 
     @abstractmethod
     def __call__(
-        self, call_next: CallNext, data: dict[str, Any]
+        self, call_next: CallNext, data: MutableMapping[str, Any]
     ) -> Any:  # pragma: no cover
         raise NotImplementedError
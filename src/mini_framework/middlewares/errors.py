@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import MutableMapping
 from typing import Any, TYPE_CHECKING
 
 from mini_framework.middlewares.base import BaseMiddleware, CallNext
@@ -12,7 +13,9 @@ if TYPE_CHECKING:
 class ErrorsMiddleware(BaseMiddleware):
     __slots__ = ()
 
-    def __call__(self, call_next: CallNext, data: dict[str, Any]) -> Any:
+    def __call__(
+        self, call_next: CallNext, data: MutableMapping[str, Any]
+    ) -> Any:
         try:
             return call_next(data)
         except SkipRoute:
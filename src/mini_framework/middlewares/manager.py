@@ -1,15 +1,21 @@
+from __future__ import annotations
+
 from collections.abc import Callable, Iterable, Iterator
 from functools import partial, wraps
-from typing import Any
+from typing import Any, TYPE_CHECKING
 
 from mini_framework.middlewares.base import CallNext, Middleware
 from mini_framework.routes.route import CallbackType
 
+if TYPE_CHECKING:
+    from mini_framework.router import Router
+
 
 class MiddlewareManager:
-    __slots__ = ("_middlewares",)
+    __slots__ = ("_router", "_middlewares")
 
-    def __init__(self) -> None:
+    def __init__(self, router: Router | None = None) -> None:
+        self._router = router
         self._middlewares: list[Middleware] = []
 
     def __iter__(self) -> Iterator[Middleware]:
@@ -24,6 +30,8 @@ class MiddlewareManager:
 
     def register(self, middleware: Middleware) -> Middleware:
         self._middlewares.append(middleware)
+        if self._router is not None:
+            self._router._invalidate()
         return middleware
 
     @staticmethod
@@ -34,7 +42,13 @@ class MiddlewareManager:
         def callback_wrapper(kwargs: dict[str, Any]) -> Any:
             return callback(**kwargs)
 
-        middleware = callback_wrapper
-        for m in reversed(tuple(middlewares)):
-            middleware = partial(m, middleware)
-        return middleware
+        return chain_middlewares(middlewares, callback_wrapper)
+
+
+def chain_middlewares(
+    middlewares: Iterable[Middleware], callback: CallbackType
+) -> CallNext:
+    middleware = callback
+    for m in reversed(tuple(middlewares)):
+        middleware = partial(m, middleware)
+    return middleware
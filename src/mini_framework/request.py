@@ -3,7 +3,14 @@ from __future__ import annotations
 import json
 import keyword
 import re
-from collections.abc import Callable
+from collections.abc import (
+    Callable,
+    ItemsView,
+    Iterator,
+    KeysView,
+    Mapping,
+    ValuesView,
+)
 from http.cookies import SimpleCookie
 from typing import Any, TYPE_CHECKING
 from urllib.parse import parse_qsl
@@ -11,6 +18,7 @@ from wsgiref.types import WSGIEnvironment
 
 from multidict import CIMultiDict
 
+from mini_framework.converters import CONVERTERS, Converter
 from mini_framework.datastructures import FormData, Address
 
 if TYPE_CHECKING:
@@ -32,6 +40,7 @@ class Request:
     __slots__ = (
         "_app",
         "_environ",
+        "_path",
         "_path_params",
         "_json_loads",
         "_body",
@@ -47,23 +56,27 @@ class Request:
         app: Application,
         environ: WSGIEnvironment,
         *,
-        path_params: dict[str, str],
+        path: str | None = None,
+        path_params: dict[str, Any],
         json_loads: Callable[..., Any] = json.loads,
     ) -> None:
         self._app = app
         self._environ = environ
+        self._path = path
         self._path_params = path_params
         self._json_loads = json_loads
         self._body: bytes | None = None
         self._json: Any | None = None
         self._query_params: dict[str, str | list[str]] | None = None
         self._form_data: FormData | None = None
-        self._headers: CIMultiDict | None = None
+        self._headers: Headers | None = None
         self._cookies: dict[str, str] | None = None
 
     @property
     def path(self) -> str:
-        return ensure_trailing_slash(self._environ["PATH_INFO"])
+        if self._path is None:
+            self._path = ensure_trailing_slash(self._environ["PATH_INFO"])
+        return self._path
 
     @property
     def method(self) -> str:
@@ -114,13 +127,13 @@ class Request:
         return self._query_params
 
     @property
-    def path_params(self) -> dict[str, str]:
+    def path_params(self) -> dict[str, Any]:
         return self._path_params
 
     @property
-    def headers(self) -> CIMultiDict:
+    def headers(self) -> Headers:
         if self._headers is None:
-            self._headers = extract_headers(self._environ)
+            self._headers = Headers(self._environ)
         return self._headers
 
     @property
@@ -163,6 +176,64 @@ class Request:
         return self.host_url + path
 
 
+class Headers(Mapping[str, str]):
+    # Single lookups read the environ key directly, the full multidict is
+    # only built when the headers are iterated
+    __slots__ = ("_environ", "_headers")
+
+    def __init__(self, environ: WSGIEnvironment) -> None:
+        self._environ = environ
+        self._headers: CIMultiDict | None = None
+
+    def __getitem__(self, key: str) -> str:
+        if self._headers is not None:
+            return self._headers[key]
+        # Iteration never produces names with underscores, they would be
+        # indistinguishable from dashes in the environ keys
+        if "_" in key:
+            raise KeyError(key)
+        environ_key = key.upper().replace("-", "_")
+        if environ_key in ("CONTENT_TYPE", "CONTENT_LENGTH"):
+            try:
+                return self._environ[environ_key]
+            except KeyError:
+                pass
+        try:
+            return self._environ["HTTP_" + environ_key]
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._multidict)
+
+    def __len__(self) -> int:
+        return len(self._multidict)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._multidict!r})"
+
+    def keys(self) -> KeysView[str]:
+        return self._multidict.keys()
+
+    def items(self) -> ItemsView[str, str]:
+        return self._multidict.items()
+
+    def values(self) -> ValuesView[str]:
+        return self._multidict.values()
+
+    def __getattr__(self, name: str) -> Any:
+        # The rest of the multidict API, e.g. getone() and getall()
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._multidict, name)
+
+    @property
+    def _multidict(self) -> CIMultiDict:
+        if self._headers is None:
+            self._headers = extract_headers(self._environ)
+        return self._headers
+
+
 def ensure_trailing_slash(path: str) -> str:
     if path[-1] == "/":
         return path
@@ -198,12 +269,34 @@ def extract_path_params_from_template(path: str) -> list[str]:
     if not params:
         return []
 
+    params = [_validate_converter(path, param) for param in params]
+
     _validate_path_params(path, params)
-    _validate_path(path, params)
+    _validate_path(strip_path_converters(path), params)
 
     return params
 
 
+def parse_path_param(param: str) -> tuple[str, Converter]:
+    name, _, converter = param.partition(":")
+    return name, CONVERTERS[converter or "str"]
+
+
+def strip_path_converters(path: str) -> str:
+    return COMPILED_PATH_PARAM_PATTERN.sub(
+        lambda match: "{" + match.group(1).partition(":")[0] + "}", path
+    )
+
+
+def _validate_converter(path: str, param: str) -> str:
+    name, _, converter = param.partition(":")
+    if converter and converter not in CONVERTERS:
+        raise ValueError(
+            f"Invalid path: {path!r}. Unknown path converter {converter!r}"
+        )
+    return name
+
+
 def _validate_path_params(path: str, params: list[str]) -> None:
     if len(params) != len(set(params)):
         raise ValueError(f"Invalid path: {path!r}. Parameters must be unique")
@@ -231,7 +324,7 @@ def _validate_path(path: str, params: list[str]) -> None:
         raise ValueError(f"Invalid path: {path!r}")
 
 
-def extract_path_params(path_template: str, path: str) -> dict[str, str]:
+def extract_path_params(path_template: str, path: str) -> dict[str, Any]:
     parts = path_template.strip("/").split("/")
 
     if parts == [""]:
@@ -244,13 +337,13 @@ def extract_path_params(path_template: str, path: str) -> dict[str, str]:
             f"Invalid path: {path!r}. Expected {len(parts)} parts, got {len(values)}"  # noqa: E501
         )
 
-    params: dict[str, str] = {}
+    params: dict[str, Any] = {}
 
     for part, value in zip(parts, values):
         if part != value:
             if match := COMPILED_PATH_PARAM_PATTERN.match(part):
-                param = match.group(1)
-                params[param] = value
+                param, converter = parse_path_param(match.group(1))
+                params[param] = converter.convert(value)
             else:
                 raise ValueError(
                     f"Invalid path: {path!r}. Expected {part!r}, got {value!r}"
@@ -1,18 +1,30 @@
 import hashlib
 import os
 import json
-from collections.abc import Mapping, Iterable
+from enum import Enum, auto
+from collections.abc import Callable, Mapping, Iterable
 from datetime import datetime
+from functools import cache
 from email.utils import format_datetime, formatdate
 from http import HTTPStatus
 from http.client import responses
 from http.cookies import BaseCookie, SimpleCookie
 from mimetypes import guess_type
+from secrets import token_hex
 from os import PathLike
 from typing import Any, Literal
 from urllib.parse import quote
 
-from multidict import CIMultiDict
+from multidict import CIMultiDict, CIMultiDictProxy
+
+from mini_framework.datastructures import ResponseHeaders
+
+
+class ResponseStrategy(Enum):
+    RESPONSE = auto()  # Response instances are returned as is
+    ANY = auto()  # Anything, including Response instances
+    MODEL = auto()  # Validated against the response type
+    BYTES = auto()  # Already encoded, served without any processing
 
 
 class Response:
@@ -34,9 +46,7 @@ class Response:
         charset: str = "utf-8",
     ) -> None:
         self.status_code = status_code
-        if headers is None:
-            headers = {}
-        self.headers = CIMultiDict(headers)
+        self.headers = ResponseHeaders(headers)
         self.media_type = media_type
         self.charset = charset
         self.content = content
@@ -155,7 +165,7 @@ class HTMLResponse(Response):
 
 
 class JSONResponse(Response):
-    __slots__ = ()
+    __slots__ = ("json_dumps",)
 
     def __init__(
         self,
@@ -165,6 +175,7 @@ class JSONResponse(Response):
         headers: Mapping[str, str] | None = None,
         media_type: str | None = None,
         charset: str = "utf-8",
+        json_dumps: Callable[[Any], bytes | str] | None = None,
     ) -> None:
         if media_type is None:
             media_type = "application/json"
@@ -175,15 +186,25 @@ class JSONResponse(Response):
             media_type=media_type,
             charset=charset,
         )
+        self.json_dumps = json_dumps
 
     def render(self) -> bytes:
-        return json.dumps(
-            self.content,
-            ensure_ascii=False,
-            allow_nan=False,
-            indent=None,
-            separators=(",", ":"),
-        ).encode(self.charset)
+        # Content already encoded by the serialization preparer
+        if isinstance(self.content, bytes):
+            return self.content
+        if self.json_dumps is None:
+            rendered = json.dumps(
+                self.content,
+                ensure_ascii=False,
+                allow_nan=False,
+                indent=None,
+                separators=(",", ":"),
+            )
+        else:
+            rendered = self.json_dumps(self.content)
+        if isinstance(rendered, str):
+            return rendered.encode(self.charset)
+        return rendered
 
 
 class RedirectResponse(Response):
@@ -225,7 +246,7 @@ class StreamingResponse(Response):
 
 
 class FileResponse(Response):
-    __slots__ = ("path", "filename", "stat_result")
+    __slots__ = ("path", "filename", "stat_result", "ranges", "boundary")
 
     chunk_size = 64 * 1024
 
@@ -265,6 +286,10 @@ class FileResponse(Response):
 
         self.stat_result = stat_result or os.stat(path)
         self.set_stat_headers()
+        self.headers.setdefault("Accept-Ranges", "bytes")
+
+        self.ranges: list[tuple[int, int]] | None = None
+        self.boundary: str | None = None
 
     def set_stat_headers(self) -> None:
         content_length = str(self.stat_result.st_size)
@@ -280,22 +305,158 @@ class FileResponse(Response):
         self.headers.setdefault("Last-Modified", last_modified)
         self.headers.setdefault("Etag", etag)
 
+    def set_ranges(self, ranges: list[tuple[int, int]]) -> None:
+        # Ranges are (start, end) pairs with an exclusive end
+        size = self.stat_result.st_size
+        self.status_code = HTTPStatus.PARTIAL_CONTENT
+        self.ranges = ranges
+        if len(ranges) == 1:
+            ((start, end),) = ranges
+            self.headers["Content-Range"] = f"bytes {start}-{end - 1}/{size}"
+            self.headers["Content-Length"] = str(end - start)
+            return
+
+        self.boundary = token_hex(16)
+        self.headers["Content-Type"] = (
+            f"multipart/byteranges; boundary={self.boundary}"
+        )
+        self.headers["Content-Length"] = str(
+            sum(
+                len(self._part_header(start, end)) + end - start + 2
+                for start, end in ranges
+            )
+            + len(self._closing_boundary())
+        )
+
+    def _part_header(self, start: int, end: int) -> bytes:
+        content_type = get_content_type(
+            self.media_type,  # pyright: ignore[reportArgumentType]
+            self.charset,
+        )
+        return (
+            f"--{self.boundary}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Range: bytes {start}-{end - 1}/{self.stat_result.st_size}"
+            "\r\n\r\n"
+        ).encode("latin-1")
+
+    def _closing_boundary(self) -> bytes:
+        return f"--{self.boundary}--\r\n".encode("latin-1")
+
+    def iter_wsgi(self, environ: Mapping[str, Any]) -> Iterable[bytes]:
+        # The server's file wrapper may hand the file to sendfile, but it
+        # always sends up to the end of the file
+        file_wrapper = environ.get("wsgi.file_wrapper")
+        if file_wrapper is None:
+            return self.iter_content()
+        if self.ranges is None:
+            return file_wrapper(open(self.path, mode="rb"), self.chunk_size)
+        if (
+            len(self.ranges) == 1
+            and self.ranges[0][1] == self.stat_result.st_size
+        ):
+            file = open(self.path, mode="rb")
+            file.seek(self.ranges[0][0])
+            return file_wrapper(file, self.chunk_size)
+        return self.iter_content()
+
     def iter_content(self) -> Iterable[bytes]:
         with open(self.path, mode="rb") as file:
-            while chunk := file.read(self.chunk_size):
-                yield chunk
+            if self.ranges is None:
+                while chunk := file.read(self.chunk_size):
+                    yield chunk
+                return
+
+            multipart = self.boundary is not None
+            for start, end in self.ranges:
+                if multipart:
+                    yield self._part_header(start, end)
+                file.seek(start)
+                remaining = end - start
+                while remaining and (
+                    chunk := file.read(min(self.chunk_size, remaining))
+                ):
+                    remaining -= len(chunk)
+                    yield chunk
+                if multipart:
+                    yield b"\r\n"
+            if multipart:
+                yield self._closing_boundary()
+
+
+class PreparedResponse(Response):
+    __slots__ = ("status_line", "body", "raw_headers")
+
+    def __init__(self, response: Response) -> None:
+        if isinstance(response, (StreamingResponse, FileResponse)):
+            raise TypeError(
+                f"{type(response).__name__} can not be prepared in advance"
+            )
+        # Everything Application.__call__ needs is rendered once, up front
+        body = response.render()
+        raw_headers = prepare_headers(response, body)
+        for name, value in (
+            ("status_code", response.status_code),
+            ("headers", CIMultiDictProxy(CIMultiDict(raw_headers))),
+            ("media_type", response.media_type),
+            ("charset", response.charset),
+            ("content", body),
+            ("status_line", get_status_code_and_phrase(response.status_code)),
+            ("body", body),
+            ("raw_headers", raw_headers),
+        ):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def render(self) -> bytes:
+        return self.body
+
+    def copy(self) -> Response:
+        # Content-Length is left out so it is recomputed if the content of
+        # the copy is replaced
+        return Response(
+            content=self.body,
+            status_code=self.status_code,
+            headers=[
+                (name, value)
+                for name, value in self.raw_headers
+                if name.lower() != "content-length"
+            ],
+            media_type=self.media_type,
+            charset=self.charset,
+        )
+
+
+STATUS_LINES: dict[int, str] = {
+    status_code: f"{status_code} {phrase}"
+    for status_code, phrase in responses.items()
+}
 
 
 def get_status_code_and_phrase(status_code: int) -> str:
-    if status_code not in responses:
-        raise ValueError(f"Invalid status code: {status_code}")
-    return f"{status_code} {responses[status_code]}"
+    try:
+        return STATUS_LINES[status_code]
+    except KeyError:
+        raise ValueError(f"Invalid status code: {status_code}") from None
 
 
 def prepare_headers(response: Response, body: bytes) -> list[tuple[str, str]]:
-    response.headers.setdefault(
-        "Content-Type", f"{response.media_type}; charset={response.charset}"
-    )
-    if not isinstance(response, (StreamingResponse, FileResponse)):
-        response.headers.setdefault("Content-Length", str(len(body)))
-    return list(response.headers.items())
+    headers = response.headers
+    if response.media_type is not None and "Content-Type" not in headers:
+        headers.add(
+            "Content-Type",
+            get_content_type(response.media_type, response.charset),
+        )
+    if (
+        not isinstance(response, (StreamingResponse, FileResponse))
+        and "Content-Length" not in headers
+    ):
+        headers.add("Content-Length", str(len(body)))
+    return headers.raw
+
+
+@cache
+def get_content_type(media_type: str, charset: str) -> str:
+    return f"{media_type}; charset={charset}"
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from collections.abc import Callable, Iterable, Sequence
 from http import HTTPMethod, HTTPStatus
 from os import PathLike
@@ -9,17 +10,39 @@ from typing import Any, Final
 from mini_framework.request import Request
 from mini_framework.errors.manager import ErrorsManager
 from mini_framework.middlewares.base import Middleware
-from mini_framework.responses import Response, JSONResponse, FileResponse
+from mini_framework.responses import (
+    JSONResponse,
+    FileResponse,
+    PreparedResponse,
+    Response,
+)
 from mini_framework.routes.manager import RoutesManager
 from mini_framework.routes.route import CallbackType, NoMatchFound
-from mini_framework.staticfiles import is_not_modified
+from mini_framework.staticfiles import (
+    StaticFilesCache,
+    get_ranges,
+    is_not_modified,
+)
+
+
+def not_found_response() -> JSONResponse:
+    return JSONResponse(
+        {"detail": HTTPStatus.NOT_FOUND.phrase},
+        status_code=HTTPStatus.NOT_FOUND,
+    )
+
+
+def not_modified_response() -> Response:
+    return Response(content=None, status_code=HTTPStatus.NOT_MODIFIED)
+
 
-NOT_FOUND_RESPONSE: Final[JSONResponse] = JSONResponse(
-    {"detail": HTTPStatus.NOT_FOUND.phrase},
-    status_code=HTTPStatus.NOT_FOUND,
+# Shared replies can only be sent by Application.__call__ itself, anything
+# passed through the middlewares is created per request to stay mutable
+NOT_FOUND_RESPONSE: Final[PreparedResponse] = PreparedResponse(
+    not_found_response()
 )
-NOT_MODIFIED_RESPONSE: Final[Response] = Response(
-    content=None, status_code=HTTPStatus.NOT_MODIFIED
+NOT_MODIFIED_RESPONSE: Final[PreparedResponse] = PreparedResponse(
+    not_modified_response()
 )
 
 
@@ -96,6 +119,11 @@ class Router:
 
         self._parent_router = router
         router._sub_routers.append(self)
+        router._invalidate()
+
+    def _invalidate(self) -> None:
+        if self._parent_router is not None:
+            self._parent_router._invalidate()
 
     def include_router(
         self,
@@ -149,18 +177,21 @@ class Router:
         directory: str | PathLike | Sequence[str | PathLike],
         *,
         name: str = "static",
+        cache: StaticFilesCache | None = None,
     ) -> None:
         if not path.startswith("/"):
             raise ValueError(f"Path {path!r} must start with '/'")
         if not path.endswith("/"):
             raise ValueError(f"Path {path!r} must end with '/'")
 
-        path = path + "{path}" + "/"
+        path = path + "{path:path}" + "/"
 
         if not isinstance(directory, Sequence) or isinstance(directory, str):
             directory = [directory]
 
-        directories = tuple(map(Path, directory))
+        directories = tuple(
+            Path(os.path.abspath(directory)) for directory in directory
+        )
 
         for directory in directories:
             if not directory.is_dir():
@@ -169,16 +200,50 @@ class Router:
                 )
 
         def callback(request: Request):
+            file = request.path_params["path"]
+
+            # Range requests are always served from the file itself and
+            # never fill the cache, which would read the whole file
+            request_cache = None if "range" in request.headers else cache
+
             for directory in directories:
-                file_path = directory / request.path_params["path"]
+                file_path = Path(os.path.normpath(directory / file))
+
+                if not file_path.is_relative_to(directory):
+                    return not_found_response()
+
+                # Entries are keyed by the file path, so mounts of different
+                # directories can share a cache
+                if request_cache is not None:
+                    cached_response = request_cache.get(file_path)
+                    if cached_response is not None:
+                        if is_not_modified(request, cached_response):
+                            return not_modified_response()
+                        return cached_response.copy()
 
                 if not file_path.is_file():
-                    return NOT_FOUND_RESPONSE
+                    return not_found_response()
 
                 response = FileResponse(file_path)
 
+                if request_cache is not None:
+                    request_cache.put(response)
+
                 if is_not_modified(request, response):
-                    return NOT_MODIFIED_RESPONSE
+                    return not_modified_response()
+
+                ranges = get_ranges(request, response)
+                if ranges is not None:
+                    if not ranges:
+                        return Response(
+                            content=None,
+                            status_code=HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE,
+                            headers={
+                                "Content-Range": "bytes */"
+                                + str(response.stat_result.st_size)
+                            },
+                        )
+                    response.set_ranges(ranges)
 
                 return response
 
@@ -207,6 +272,7 @@ class Router:
         status_code: int = HTTPStatus.OK,
         response_class: type[Response] | None = None,
         response_model: type | None = None,
+        response_validation_rate: float | None = None,
     ) -> Callable[[CallbackType], CallbackType]:
         return self.route(
             path,
@@ -216,6 +282,7 @@ class Router:
             status_code=status_code,
             response_class=response_class,
             response_model=response_model,
+            response_validation_rate=response_validation_rate,
         )
 
     def get(
@@ -227,6 +294,7 @@ class Router:
         status_code: int = HTTPStatus.OK,
         response_class: type[Response] | None = None,
         response_model: type | None = None,
+        response_validation_rate: float | None = None,
     ) -> Callable[[CallbackType], CallbackType]:
         return self.route(
             path,
@@ -236,6 +304,7 @@ class Router:
             status_code=status_code,
             response_class=response_class,
             response_model=response_model,
+            response_validation_rate=response_validation_rate,
         )
 
     def head(
@@ -247,6 +316,7 @@ class Router:
         status_code: int = HTTPStatus.OK,
         response_class: type[Response] | None = None,
         response_model: type | None = None,
+        response_validation_rate: float | None = None,
     ) -> Callable[[CallbackType], CallbackType]:
         return self.route(
             path,
@@ -256,6 +326,7 @@ class Router:
             status_code=status_code,
             response_class=response_class,
             response_model=response_model,
+            response_validation_rate=response_validation_rate,
         )
 
     def options(
@@ -267,6 +338,7 @@ class Router:
         status_code: int = HTTPStatus.OK,
         response_class: type[Response] | None = None,
         response_model: type | None = None,
+        response_validation_rate: float | None = None,
     ) -> Callable[[CallbackType], CallbackType]:
         return self.route(
             path,
@@ -276,6 +348,7 @@ class Router:
             status_code=status_code,
             response_class=response_class,
             response_model=response_model,
+            response_validation_rate=response_validation_rate,
         )
 
     def patch(
@@ -287,6 +360,7 @@ class Router:
         status_code: int = HTTPStatus.OK,
         response_class: type[Response] | None = None,
         response_model: type | None = None,
+        response_validation_rate: float | None = None,
     ) -> Callable[[CallbackType], CallbackType]:
         return self.route(
             path,
@@ -296,6 +370,7 @@ class Router:
             status_code=status_code,
             response_class=response_class,
             response_model=response_model,
+            response_validation_rate=response_validation_rate,
         )
 
     def post(
@@ -307,6 +382,7 @@ class Router:
         status_code: int = HTTPStatus.OK,
         response_class: type[Response] | None = None,
         response_model: type | None = None,
+        response_validation_rate: float | None = None,
     ) -> Callable[[CallbackType], CallbackType]:
         return self.route(
             path,
@@ -316,6 +392,7 @@ class Router:
             status_code=status_code,
             response_class=response_class,
             response_model=response_model,
+            response_validation_rate=response_validation_rate,
         )
 
     def put(
@@ -327,6 +404,7 @@ class Router:
         status_code: int = HTTPStatus.OK,
         response_class: type[Response] | None = None,
         response_model: type | None = None,
+        response_validation_rate: float | None = None,
     ) -> Callable[[CallbackType], CallbackType]:
         return self.route(
             path,
@@ -336,6 +414,7 @@ class Router:
             status_code=status_code,
             response_class=response_class,
             response_model=response_model,
+            response_validation_rate=response_validation_rate,
         )
 
     def trace(
@@ -347,6 +426,7 @@ class Router:
         status_code: int = HTTPStatus.OK,
         response_class: type[Response] | None = None,
         response_model: type | None = None,
+        response_validation_rate: float | None = None,
     ) -> Callable[[CallbackType], CallbackType]:
         return self.route(
             path,
@@ -356,4 +436,5 @@ class Router:
             status_code=status_code,
             response_class=response_class,
             response_model=response_model,
+            response_validation_rate=response_validation_rate,
         )
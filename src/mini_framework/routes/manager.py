@@ -1,18 +1,20 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Iterator
-from dataclasses import fields
+from collections.abc import Callable, Iterator, MutableMapping
 from http import HTTPMethod, HTTPStatus
+from random import random
 from typing import Any, TYPE_CHECKING
 from unittest.mock import sentinel
 
 from mini_framework.routes.params_resolvers import resolve_params
+from mini_framework.routes.plan import RoutePlan
 from mini_framework.serialization_preparer.base import SerializationPreparer
 from mini_framework.validators.base import Validator
+from mini_framework.exceptions import ResponseValidationError
 from mini_framework.request import Request
 from mini_framework.middlewares.base import Middleware
 from mini_framework.middlewares.manager import MiddlewareManager
-from mini_framework.responses import Response
+from mini_framework.responses import Response, ResponseStrategy
 from mini_framework.routes.route import Route
 from mini_framework.routes.route import CallableObject, CallbackType
 
@@ -39,8 +41,8 @@ class RoutesManager:
         self._router = router
         self._routes: list[Route] = []
 
-        self.outer_middleware = MiddlewareManager()
-        self.middleware = MiddlewareManager()
+        self.outer_middleware = MiddlewareManager(router)
+        self.middleware = MiddlewareManager(router)
 
         # This route is used to check root filters
         self._route = Route(
@@ -53,82 +55,120 @@ class RoutesManager:
     def __iter__(self) -> Iterator[Route]:
         return iter(self._routes)
 
-    def wrap_outer_middleware(
-        self, callback: Any, data: dict[str, Any]
-    ) -> Any:
-        wrapped_outer = self.middleware.wrap_middlewares(
-            self.outer_middleware,
-            callback,
-        )
-        return wrapped_outer(data)
-
     def filter(self, *filters: CallbackType) -> None:
         self._route.filters.extend(
             [CallableObject(callback=filter) for filter in filters],
         )
 
-    def check_root_filters(self, **kwargs: Any) -> tuple[bool, dict[str, Any]]:
-        return self._route.check(**kwargs)
+    def compile(
+        self,
+        route: Route,
+        *,
+        outer_middlewares: tuple[Middleware, ...],
+        validator: Validator,
+        serialization_preparer: SerializationPreparer,
+        response_validation_rate: float,
+    ) -> RoutePlan:
+        head_routers = tuple(reversed(tuple(self._router.chain_head)))
+        return RoutePlan(
+            router=self._router,
+            route=route,
+            root_filters=tuple(router.route._route for router in head_routers),
+            outer_middlewares=outer_middlewares,
+            middlewares=tuple(
+                middleware
+                for router in head_routers
+                for middleware in router.route.middleware
+            ),
+            response_class=(
+                route.response_class or self._router.default_response_class
+            ),
+            validator=validator,
+            serialization_preparer=serialization_preparer,
+            response_validation_rate=(
+                1
+                if route.projects_response
+                else route.response_validation_rate
+                if route.response_validation_rate is not None
+                else response_validation_rate
+            ),
+        )
 
-    def trigger(self, **kwargs: Any) -> Any:
-        for head_router in reversed(tuple(self._router.chain_head)):
-            result, data = head_router.route.check_root_filters(**kwargs)
-            if not result:
+    def trigger(
+        self, plan: RoutePlan, data: MutableMapping[str, Any], /
+    ) -> Any:
+        for root_filter in plan.root_filters:
+            if not root_filter.check(data):
                 return UNHANDLED
-            kwargs.update(data)
 
-        route: Route = kwargs["route"]
+        route = plan.route
 
-        result, data = route.check(**kwargs)
+        if route.check(data):
+            request: Request = data["request"]
 
-        if result:
-            kwargs.update(data)
+            validator = plan.validator
 
-            request: Request = kwargs["request"]
+            if route.skip_request_validation:
+                params = resolve_params(route, request)
+            elif route.body_model_param is None:
+                resolved_params = resolve_params(route, request)
 
-            resolved_params = resolve_params(route, request)
-
-            validator: Validator = kwargs["validator"]
+                params = (
+                    None
+                    if route.params_coercer is None
+                    else route.params_coercer(resolved_params)
+                )
 
-            obj = validator.validate_request(resolved_params, route.model)
+                if params is None:
+                    obj = validator.validate_request(
+                        resolved_params, route.model
+                    )
 
-            params = {
-                field.name: getattr(obj, field.name)
-                for field in fields(route.model)
-            }
+                    params = {
+                        name: getattr(obj, name) for name in route.model_fields
+                    }
+            else:
+                params = {
+                    route.body_model_param: validator.validate_request_body(
+                        request,
+                        route.body_models[route.body_model_param],
+                        route.body_model_param,
+                    )
+                }
 
-            kwargs.update(params)
+            data.update(params)
 
             try:
-                wrapped_inner = self.middleware.wrap_middlewares(
-                    self._resolve_middlewares(),  # noqa: B038
-                    route.call,
-                )
-                response = wrapped_inner(kwargs)
+                response = plan.inner_chain(data)
             except SkipRoute:
                 return UNHANDLED
             else:
-                return_type = (
-                    route.response_model
-                    if route.response_model is not None
-                    else route.return_annotation
-                )
-                obj = validator.validate_response(response, return_type)
-                serialization_preparer: SerializationPreparer = data[
-                    "serialization_preparer"
-                ]
-                return serialization_preparer.prepare_response(
-                    obj, return_type
+                strategy = route.response_strategy
+                if strategy is ResponseStrategy.BYTES:
+                    return response
+                return_type = route.response_type
+                rate = plan.response_validation_rate
+                if strategy is not ResponseStrategy.MODEL:
+                    obj = response
+                elif rate == 1:
+                    obj = validator.validate_response(response, return_type)
+                elif rate and random() < rate:
+                    # A sampled failure is counted, the response is served
+                    try:
+                        obj = validator.validate_response(
+                            response, return_type
+                        )
+                    except ResponseValidationError:
+                        route.response_validation_failures += 1
+                        obj = response
+                else:
+                    obj = response
+                return plan.serialization_preparer.prepare_response(
+                    obj, return_type, strategy
                 )
 
         return UNHANDLED
 
-    def _resolve_middlewares(self) -> list[Middleware]:
-        middlewares: list[Middleware] = []
-        for router in reversed(tuple(self._router.chain_head)):
-            middlewares.extend(tuple(router.route.middleware))
-        return middlewares
-
     def __call__(
         self,
         path: str,
@@ -139,6 +179,7 @@ class RoutesManager:
         status_code: int = HTTPStatus.OK,
         response_class: type[Response] | None = None,
         response_model: type | None = None,
+        response_validation_rate: float | None = None,
     ) -> Callable[[CallbackType], CallbackType]:
         def wrapper(callback: CallbackType) -> CallbackType:
             self.register(
@@ -150,6 +191,7 @@ class RoutesManager:
                 status_code=status_code,
                 response_class=response_class,
                 response_model=response_model,
+                response_validation_rate=response_validation_rate,
             )
             return callback
 
@@ -166,6 +208,7 @@ class RoutesManager:
         status_code: int = HTTPStatus.OK,
         response_class: type[Response] | None = None,
         response_model: type | None = None,
+        response_validation_rate: float | None = None,
     ) -> CallbackType:
         if name is None:
             name = callback.__name__
@@ -181,6 +224,8 @@ class RoutesManager:
                 status_code=status_code,
                 response_class=response_class,
                 response_model=response_model,
+                response_validation_rate=response_validation_rate,
             )
         )
+        self._router._invalidate()
         return callback
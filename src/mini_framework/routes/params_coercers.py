@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from dataclasses import MISSING, fields
+from types import NoneType, UnionType
+from typing import Any, TYPE_CHECKING, TypeAlias, Union, get_args, get_origin
+
+if TYPE_CHECKING:
+    from mini_framework.routes.route import Route
+
+
+Coercer: TypeAlias = Callable[[Any], Any]
+ParamsCoercer: TypeAlias = Callable[[dict[str, Any]], dict[str, Any] | None]
+
+# Only the plain forms the validator is known to convert the same way are
+# coerced, e.g. "1.0" as an int or "١٢" are left to the validator
+INT_PATTERN = re.compile(r"[+-]?[0-9]+")
+FLOAT_PATTERN = re.compile(
+    r"[+-]?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)(?:[eE][+-]?[0-9]+)?"
+)
+TRUE_VALUES = frozenset({"1", "on", "t", "true", "y", "yes"})
+FALSE_VALUES = frozenset({"0", "off", "f", "false", "n", "no"})
+
+
+class CoercionError(ValueError):
+    pass
+
+
+def compile_params_coercer(route: Route) -> ParamsCoercer | None:
+    # Only params that arrive as strings from the URL and headers are
+    # coerced here, anything else is left to the configured validator
+    simple_params = (
+        route.path_params | route.query_params | route.headers | route.cookies
+    )
+
+    plan: list[tuple[str, Coercer, Any]] = []
+
+    for model_field in fields(route.model):
+        if model_field.name not in simple_params:
+            return None
+        # Extra metadata (e.g. constraints) is only understood by validators
+        if len(model_field.type.__metadata__) != 1:
+            return None
+        coercer = _get_coercer(get_args(model_field.type)[0])
+        if coercer is None:
+            return None
+        plan.append((model_field.name, coercer, model_field.default))
+
+    def coerce_params(params: dict[str, Any]) -> dict[str, Any] | None:
+        # None hands the params over to the validator, which then reports
+        # any errors in its own format
+        result: dict[str, Any] = {}
+
+        for name, coercer, default in plan:
+            if name in params:
+                try:
+                    result[name] = coercer(params[name])
+                except CoercionError:
+                    return None
+            elif default is MISSING:
+                return None
+            else:
+                result[name] = default
+
+        return result
+
+    return coerce_params
+
+
+def _get_coercer(type_: Any) -> Coercer | None:
+    if type_ in COERCERS:
+        return COERCERS[type_]
+
+    origin = get_origin(type_)
+    args = get_args(type_)
+
+    if origin in (Union, UnionType) and len(args) == 2 and NoneType in args:
+        (inner,) = (arg for arg in args if arg is not NoneType)
+        coercer = _get_coercer(inner)
+        if coercer is not None:
+            return _optional_coercer(coercer)
+    elif origin is list and len(args) == 1 and args[0] in COERCERS:
+        return _list_coercer(COERCERS[args[0]])
+
+    return None
+
+
+def _coerce_str(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    raise CoercionError(value)
+
+
+def _coerce_int(value: Any) -> int:
+    if isinstance(value, str) and INT_PATTERN.fullmatch(value):
+        try:
+            return int(value)
+        except ValueError:  # occurs when the string has too many digits
+            pass
+    raise CoercionError(value)
+
+
+def _coerce_float(value: Any) -> float:
+    if isinstance(value, str) and FLOAT_PATTERN.fullmatch(value):
+        return float(value)
+    raise CoercionError(value)
+
+
+def _coerce_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        lowered = value.lower()
+        if lowered in TRUE_VALUES:
+            return True
+        if lowered in FALSE_VALUES:
+            return False
+    raise CoercionError(value)
+
+
+def _optional_coercer(coercer: Coercer) -> Coercer:
+    def coerce_optional(value: Any) -> Any:
+        if value is None:
+            return None
+        return coercer(value)
+
+    return coerce_optional
+
+
+def _list_coercer(coercer: Coercer) -> Coercer:
+    def coerce_list(value: Any) -> list[Any]:
+        if not isinstance(value, list):
+            raise CoercionError(value)
+        return [coercer(item) for item in value]
+
+    return coerce_list
+
+
+COERCERS: dict[Any, Coercer] = {
+    str: _coerce_str,
+    int: _coerce_int,
+    float: _coerce_float,
+    bool: _coerce_bool,
+}
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping
 from dataclasses import fields
-from typing import Any, get_args, TYPE_CHECKING
+from typing import Any, get_args, TYPE_CHECKING, TypeAlias
 
 from mini_framework.datastructures import UploadFile
 from mini_framework.request import Request
@@ -10,30 +11,58 @@ if TYPE_CHECKING:
     from mini_framework.routes.route import Route
 
 
+ParamsResolver: TypeAlias = Callable[..., None]
+
+
 def resolve_params(route: Route, request: Request) -> dict[str, Any]:
-    params = {}
-
-    _resolve_path_params(route, request, params=params)
-    _resolve_query_params(route, request, params=params)
-    _resolve_body_params(route, request, params=params)
-    _resolve_body_model_params(route, request, params=params)
-    _resolve_field_params(route, request, params=params)
-    _resolve_file_params(route, request, params=params)
-    _resolve_upload_file_params(route, request, params=params)
-    _resolve_header_params(route, request, params=params)
-    _resolve_cookie_params(route, request, params=params)
+    params: dict[str, Any] = {}
+
+    for resolver in route.params_resolvers:
+        resolver(route, request, params=params)
 
     return params
 
 
+def compile_params_resolvers(route: Route) -> tuple[ParamsResolver, ...]:
+    resolvers: list[ParamsResolver] = []
+
+    if route.path_params:
+        resolvers.append(_resolve_path_params)
+    if route.query_params:
+        resolvers.append(_resolve_query_params)
+    if route.bodies:
+        resolvers.append(_resolve_body_params)
+    if route.body_models:
+        resolvers.append(_resolve_body_model_params)
+    if route.fields:
+        resolvers.append(_resolve_field_params)
+    if route.files:
+        resolvers.append(_resolve_file_params)
+    if route.upload_files or route.upload_files_param is not None:
+        resolvers.append(_resolve_upload_file_params)
+    if route.headers:
+        resolvers.append(_resolve_header_params)
+    if route.cookies:
+        resolvers.append(_resolve_cookie_params)
+
+    return tuple(resolvers)
+
+
+def _pick(
+    names: set[str], values: Mapping[str, Any], params: dict[str, Any]
+) -> None:
+    for name in names:
+        if name in values:
+            params[name] = values[name]
+
+
 def _resolve_path_params(
     route: Route,
     request: Request,
     *,
     params: dict[str, Any],
 ) -> None:
-    if route.path_params:
-        params.update(request.path_params)
+    _pick(route.path_params, request.path_params, params)
 
 
 def _resolve_query_params(
@@ -42,8 +71,7 @@ def _resolve_query_params(
     *,
     params: dict[str, Any],
 ) -> None:
-    if route.query_params:
-        params.update(request.query_params)
+    _pick(route.query_params, request.query_params, params)
 
 
 def _resolve_body_params(
@@ -52,9 +80,7 @@ def _resolve_body_params(
     *,
     params: dict[str, Any],
 ) -> None:
-    if route.bodies:
-        body = request.json()
-        params.update(body)
+    _pick(route.bodies, request.json(), params)
 
 
 def _resolve_body_model_params(
@@ -63,29 +89,28 @@ def _resolve_body_model_params(
     *,
     params: dict[str, Any],
 ) -> None:
-    if route.body_models:
-        body = request.json()
+    body = request.json()
 
-        for param, annotation in route.body_models.items():
-            model, model_param = get_args(annotation)
+    for param, annotation in route.body_models.items():
+        model, model_param = get_args(annotation)
 
-            params[param] = {}
+        params[param] = {}
 
-            is_single_model = (len(route.body_models) + len(route.bodies)) == 1
+        is_single_model = (len(route.body_models) + len(route.bodies)) == 1
 
-            if is_single_model and not model_param.embed:
-                embed = False
-            else:
-                embed = True
+        if is_single_model and not model_param.embed:
+            embed = False
+        else:
+            embed = True
 
-            for field in fields(model):
-                try:
-                    if embed:
-                        params[param][field.name] = body[param][field.name]
-                    else:
-                        params[param][field.name] = body[field.name]
-                except KeyError:
-                    pass
+        for field in fields(model):
+            try:
+                if embed:
+                    params[param][field.name] = body[param][field.name]
+                else:
+                    params[param][field.name] = body[field.name]
+            except KeyError:
+                pass
 
 
 def _resolve_field_params(
@@ -94,16 +119,14 @@ def _resolve_field_params(
     *,
     params: dict[str, Any],
 ) -> None:
-    if route.fields:
-        form = request.form()
+    form = request.form()
 
-        if not form.fields:
-            return
+    if not form.fields:
+        return
 
-        for param in route.fields:
-            for field in form.fields:
-                if field.field_name.decode() == param:
-                    params[param] = field.value.decode()
+    for param in route.fields:
+        if fields := form.get_fields(param):
+            params[param] = fields[-1].value.decode()
 
 
 def _resolve_file_params(
@@ -112,20 +135,16 @@ def _resolve_file_params(
     *,
     params: dict[str, Any],
 ) -> None:
-    if route.files:
-        form = request.form()
+    form = request.form()
 
-        if not form.files:
-            return
+    if not form.files:
+        return
 
-        for param in route.files:
-            for file in form.files:
-                if (
-                    file.field_name is not None
-                    and file.field_name.decode() == param
-                ):
-                    file.file_object.seek(0)
-                    params[param] = file.file_object.read()
+    for param in route.files:
+        if files := form.get_files(param):
+            file_object = files[-1].file_object
+            file_object.seek(0)
+            params[param] = file_object.read()
 
 
 def _resolve_upload_file_params(
@@ -134,38 +153,37 @@ def _resolve_upload_file_params(
     *,
     params: dict[str, Any],
 ) -> None:
-    if route.upload_files or route.upload_files_param is not None:
-        try:
-            form = request.form()
-        except ValueError as e:
-            if str(e) == "No Content-Type header given!":
-                return
-            else:
-                raise
-
-        if not form.files:
+    try:
+        form = request.form()
+    except ValueError as e:
+        if str(e) == "No Content-Type header given!":
             return
+        else:
+            raise
 
-        upload_files: list[UploadFile] = []
+    if not form.files:
+        return
 
-        for file in form.files:
-            file.file_object.seek(0)
-            upload_files.append(
-                UploadFile(
-                    file.file_object,
-                    size=file.size,
-                    filename=file.file_name,
-                ),
-            )
+    upload_files: list[UploadFile] = []
 
-        for param in route.upload_files:
-            try:
-                params[param] = upload_files.pop(0)
-            except IndexError:
-                return
+    for file in form.files:
+        file.file_object.seek(0)
+        upload_files.append(
+            UploadFile(
+                file.file_object,
+                size=file.size,
+                filename=file.file_name,
+            ),
+        )
 
-        if route.upload_files_param is not None:
-            params[route.upload_files_param] = upload_files
+    for param in route.upload_files:
+        try:
+            params[param] = upload_files.pop(0)
+        except IndexError:
+            return
+
+    if route.upload_files_param is not None:
+        params[route.upload_files_param] = upload_files
 
 
 def _resolve_header_params(
@@ -174,9 +192,7 @@ def _resolve_header_params(
     *,
     params: dict[str, Any],
 ) -> None:
-    if route.headers:
-        for key, value in request.headers.items():
-            params[key.lower()] = value
+    _pick(route.headers, request.headers, params)
 
 
 def _resolve_cookie_params(
@@ -185,5 +201,4 @@ def _resolve_cookie_params(
     *,
     params: dict[str, Any],
 ) -> None:
-    if route.cookies:
-        params.update(request.cookies)
+    _pick(route.cookies, request.cookies, params)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from collections.abc import (
+    Callable,
+    ItemsView,
+    Iterator,
+    KeysView,
+    ValuesView,
+)
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, TYPE_CHECKING
+
+from mini_framework.middlewares.base import CallNext, Middleware
+from mini_framework.middlewares.manager import chain_middlewares
+from mini_framework.responses import Response
+from mini_framework.routes.route import HandlerObject, Route
+from mini_framework.serialization_preparer.base import SerializationPreparer
+from mini_framework.validators.base import Validator
+
+if TYPE_CHECKING:
+    from mini_framework.router import Router
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RoutePlan:
+    router: Router
+    route: Route
+    root_filters: tuple[HandlerObject, ...]
+    outer_middlewares: tuple[Middleware, ...]
+    middlewares: tuple[Middleware, ...]
+    response_class: type[Response]
+    validator: Validator
+    serialization_preparer: SerializationPreparer
+    response_validation_rate: float
+    trigger: Callable[..., Any] = field(init=False, repr=False)
+    outer_chain: CallNext = field(init=False, repr=False)
+    inner_chain: CallNext = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # The middleware chains are composed once per plan, dispatch only
+        # calls them
+        trigger = partial(self.router.route.trigger, self)
+        object.__setattr__(self, "trigger", trigger)
+        object.__setattr__(
+            self,
+            "outer_chain",
+            chain_middlewares(self.outer_middlewares, trigger),
+        )
+        object.__setattr__(
+            self,
+            "inner_chain",
+            chain_middlewares(self.middlewares, self.route.call_with),
+        )
+
+
+class RouteScope(dict[str, Any]):
+    __slots__ = ("_plan",)
+
+    def __init__(self, plan: RoutePlan) -> None:
+        super().__init__(router=plan.router, route=plan.route)
+        self._plan = plan
+
+    def __contains__(self, key: object) -> bool:
+        return key == "response" or super().__contains__(key)
+
+    # "response" is listed before it is built, so ** expansion, dict() and
+    # ChainMap see it and build it through __getitem__ only when read
+    def __iter__(self) -> Iterator[str]:
+        yield from super().__iter__()
+        if not super().__contains__("response"):
+            yield "response"
+
+    def __len__(self) -> int:
+        return super().__len__() + (not super().__contains__("response"))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+    def keys(self) -> KeysView[str]:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return KeysView(self)
+
+    def items(self) -> ItemsView[str, Any]:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return ItemsView(self)
+
+    def values(self) -> ValuesView[Any]:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return ValuesView(self)
+
+    def __missing__(self, key: str) -> Any:
+        # The injectable response is only built when somebody asks for it
+        if key != "response":
+            raise KeyError(key)
+        response = self["response"] = self._plan.response_class(
+            content=None, status_code=self._plan.route.status_code
+        )
+        return response
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import inspect
-from collections.abc import Callable
+from collections import ChainMap
+from collections.abc import Callable, Mapping, MutableMapping
 from dataclasses import dataclass, field, make_dataclass
 from http import HTTPMethod, HTTPStatus
 from typing import (
@@ -25,8 +26,21 @@ from mini_framework.params import (
     Param,
     BodyModel,
 )
-from mini_framework.responses import Response
-from mini_framework.request import Request, extract_path_params_from_template
+from mini_framework.responses import Response, ResponseStrategy
+from mini_framework.routes.params_coercers import (
+    ParamsCoercer,
+    compile_params_coercer,
+)
+from mini_framework.routes.params_resolvers import (
+    ParamsResolver,
+    compile_params_resolvers,
+)
+from mini_framework.request import (
+    COMPILED_PATH_PARAM_PATTERN,
+    extract_path_params_from_template,
+    parse_path_param,
+    strip_path_converters,
+)
 
 CallbackType: TypeAlias = Callable[..., Any]
 
@@ -49,13 +63,18 @@ class CallableObject:
         self.params = [*spec.args, *spec.kwonlyargs]
         self.varkw = spec.varkw is not None
 
-    def _prepare_kwargs(self, kwargs: dict[str, Any], /) -> dict[str, Any]:
+    def _prepare_kwargs(
+        self, kwargs: Mapping[str, Any], /
+    ) -> Mapping[str, Any]:
         if self.varkw:
             return kwargs
         return {key: kwargs[key] for key in self.params if key in kwargs}
 
     def call(self, **kwargs: Any) -> Any:
-        kwargs = self._prepare_kwargs(kwargs)
+        return self.call_with(kwargs)
+
+    def call_with(self, data: Mapping[str, Any], /) -> Any:
+        kwargs = self._prepare_kwargs(data)
         return self.callback(**kwargs)
 
 
@@ -63,16 +82,21 @@ class CallableObject:
 class HandlerObject(CallableObject):
     filters: list[CallableObject] = field(default_factory=list)
 
-    def check(self, **kwargs: Any) -> tuple[bool, dict[str, Any]]:
+    def check(self, data: MutableMapping[str, Any], /) -> bool:
         if not self.filters:
-            return True, kwargs
+            return True
+        # Filters see the data added by previous filters, but it is merged
+        # into the caller's data only when every filter passes
+        updates: dict[str, Any] = {}
+        scope = ChainMap(updates, data)
         for filter in self.filters:
-            check = filter.call(**kwargs)
+            check = filter.call_with(scope)
             if not check:
-                return False, kwargs
+                return False
             if isinstance(check, dict):
-                kwargs.update(check)
-        return True, kwargs
+                updates.update(check)
+        data.update(updates)
+        return True
 
 
 @dataclass(slots=True, kw_only=True)
@@ -83,9 +107,16 @@ class Route(HandlerObject):
     status_code: int = HTTPStatus.OK
     response_class: type[Response] | None = None
     response_model: type | None = None
+    response_validation_rate: float | None = None
+    response_validation_failures: int = field(init=False, default=0)
     path_params_in_path: list[str] = field(init=False)
+    path_format: str = field(init=False)
     model: type = field(init=False)
+    model_fields: tuple[str, ...] = field(init=False)
     return_annotation: Any = field(default=None)
+    response_type: Any = field(init=False)
+    response_strategy: ResponseStrategy = field(init=False)
+    projects_response: bool = field(init=False, default=False)
     path_params: set[str] = field(default_factory=set)
     query_params: set[str] = field(default_factory=set)
     bodies: set[str] = field(default_factory=set)
@@ -96,6 +127,10 @@ class Route(HandlerObject):
     upload_files_param: str | None = field(default=None)
     headers: set[str] = field(default_factory=set)
     cookies: set[str] = field(default_factory=set)
+    body_model_param: str | None = field(init=False, default=None)
+    skip_request_validation: bool = field(init=False, default=False)
+    params_coercer: ParamsCoercer | None = field(init=False, default=None)
+    params_resolvers: tuple[ParamsResolver, ...] = field(init=False)
 
     def __post_init__(self) -> None:
         if not self.path.startswith("/"):
@@ -106,9 +141,12 @@ class Route(HandlerObject):
             raise ValueError(
                 f"Method {self.method!r} is not valid HTTP method"
             )
+        if self.response_validation_rate is not None:
+            validate_response_validation_rate(self.response_validation_rate)
         super(Route, self).__post_init__()
 
         self.path_params_in_path = extract_path_params_from_template(self.path)
+        self.path_format = strip_path_converters(self.path)
 
         callback = inspect.unwrap(self.callback)
         signature = inspect.signature(callback)
@@ -118,6 +156,29 @@ class Route(HandlerObject):
         else:
             self.return_annotation = signature.return_annotation
 
+        self.response_type = (
+            self.response_model
+            if self.response_model is not None
+            else self.return_annotation
+        )
+        self.response_strategy = get_response_strategy(self.response_type)
+        # Only validation reshapes the result into a response_model that is
+        # not the return annotation, so it can not be sampled
+        self.projects_response = (
+            self.response_strategy is ResponseStrategy.MODEL
+            and self.response_model is not None
+            and self.response_model != self.return_annotation
+        )
+        if (
+            self.projects_response
+            and self.response_validation_rate is not None
+            and self.response_validation_rate < 1
+        ):
+            raise ValueError(
+                "Response validation can not be sampled when response_model "
+                "differs from the return annotation"
+            )
+
         names: list[str] = []
 
         for param in signature.parameters.values():
@@ -168,6 +229,41 @@ class Route(HandlerObject):
                 fields.append((param.name, param.annotation, param.default))
 
         self.model = make_dataclass("Model", fields, frozen=True, slots=True)
+        self.model_fields = tuple(model_field[0] for model_field in fields)
+
+        # A route that takes nothing but one not embedded body model gets
+        # its model decoded from the raw body by the validator
+        if len(names) == 1 and names[0] in self.body_models:
+            _, model_param = get_args(self.body_models[names[0]])
+            if not model_param.embed:
+                self.body_model_param = names[0]
+
+        # Path params are already converted by the route tree, so a route
+        # that takes nothing else has nothing left for the validator to do
+        converters = dict(
+            map(
+                parse_path_param,
+                COMPILED_PATH_PARAM_PATTERN.findall(self.path),
+            )
+        )
+        self.skip_request_validation = all(
+            len(model_field) == 2
+            and model_field[0] in self.path_params
+            and model_field[0] in converters
+            # Extra metadata (e.g. constraints) still needs the validator
+            and len(model_field[1].__metadata__) == 1
+            and get_args(model_field[1])[0]
+            is converters[model_field[0]].python_type
+            for model_field in fields
+        )
+
+        if self.body_model_param is None:
+            self.params_resolvers = compile_params_resolvers(self)
+        else:
+            self.params_resolvers = ()
+
+        if not self.skip_request_validation and self.body_model_param is None:
+            self.params_coercer = compile_params_coercer(self)
 
     def url_path_for(self, name: str, /, **path_params: Any) -> str:
         if self.name != name:
@@ -175,27 +271,23 @@ class Route(HandlerObject):
         if len(self.path_params_in_path) != len(path_params):
             raise NoMatchFound
         try:
-            return self.path.format_map(path_params)
+            return self.path_format.format_map(path_params)
         except KeyError:  # occurs when path_params do not match
             raise NoMatchFound
 
-    def match(self, request: Request) -> bool:
-        if request.method != self.method:
-            return False
-        if not request.path_params:
-            return self.path == request.path
-        try:
-            return request.path == self.path.format_map(request.path_params)
-        except KeyError:  # occurs when path_params do not match
-            return False
 
-    def check(self, **kwargs: Any) -> tuple[bool, dict[str, Any]]:
-        if not self.filters:
-            return True, kwargs
-        for filter in self.filters:
-            check = filter.call(**kwargs)
-            if not check:
-                return False, kwargs
-            if isinstance(check, dict):
-                kwargs.update(check)
-        return True, kwargs
+def validate_response_validation_rate(rate: float) -> None:
+    if not 0 <= rate <= 1:
+        raise ValueError(
+            f"Response validation rate {rate!r} must be between 0 and 1"
+        )
+
+
+def get_response_strategy(response_type: Any) -> ResponseStrategy:
+    if response_type is Any:
+        return ResponseStrategy.ANY
+    if inspect.isclass(response_type) and issubclass(response_type, Response):
+        return ResponseStrategy.RESPONSE
+    if response_type is bytes:
+        return ResponseStrategy.BYTES
+    return ResponseStrategy.MODEL
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Any, TYPE_CHECKING
+
+from mini_framework.converters import Converter, PathConverter
+from mini_framework.request import (
+    COMPILED_PATH_PARAM_PATTERN,
+    parse_path_param,
+)
+from mini_framework.responses import JSONResponse, PreparedResponse
+
+if TYPE_CHECKING:
+    from mini_framework.routes.plan import RoutePlan
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RouteMatch:
+    path: str
+    path_params: dict[str, Any]
+    candidates: list[RoutePlan]
+
+
+class RouteNode:
+    __slots__ = ("static", "params", "param", "path", "routes")
+
+    def __init__(self, param: tuple[str, Converter] | None = None) -> None:
+        self.static: dict[str, RouteNode] = {}
+        self.params: dict[str, RouteNode] = {}
+        self.param = param
+        self.path: str | None = None
+        self.routes: dict[str, list[RoutePlan]] = {}
+
+
+class RouteTree:
+    __slots__ = ("_root", "_method_not_allowed_responses")
+
+    def __init__(self, plans: Iterable[RoutePlan] = ()) -> None:
+        self._root = RouteNode()
+        self._method_not_allowed_responses: dict[
+            tuple[str, ...], PreparedResponse
+        ] = {}
+        for plan in plans:
+            self.add(plan)
+
+    def add(self, plan: RoutePlan) -> None:
+        route = plan.route
+        node = self._root
+        for part in split_path(route.path):
+            if match := COMPILED_PATH_PARAM_PATTERN.fullmatch(part):
+                param = match.group(1)
+                if param not in node.params:
+                    node.params[param] = RouteNode(parse_path_param(param))
+                node = node.params[param]
+            else:
+                node = node.static.setdefault(part, RouteNode())
+        if node.path is None:
+            node.path = route.path
+        node.routes.setdefault(route.method, []).append(plan)
+
+    def lookup(self, method: str, path: str) -> RouteMatch | None:
+        path_params: dict[str, Any] = {}
+        node = _match_node(
+            self._root, split_path(path), 0, path_params, method
+        )
+        if node is None:
+            return None
+        return RouteMatch(
+            path=node.path,  # pyright: ignore[reportArgumentType]
+            path_params=path_params,
+            candidates=node.routes[method],
+        )
+
+    def allowed_methods(self, path: str) -> tuple[str, ...]:
+        methods: dict[str, None] = {}
+        _collect_methods(self._root, split_path(path), 0, methods)
+        return tuple(methods)
+
+    def method_not_allowed_response(
+        self, path: str
+    ) -> PreparedResponse | None:
+        allowed_methods = self.allowed_methods(path)
+        if not allowed_methods:
+            return None
+        response = self._method_not_allowed_responses.get(allowed_methods)
+        if response is None:
+            response = PreparedResponse(
+                JSONResponse(
+                    {"detail": HTTPStatus.METHOD_NOT_ALLOWED.phrase},
+                    status_code=HTTPStatus.METHOD_NOT_ALLOWED,
+                    headers={"Allow": ", ".join(allowed_methods)},
+                )
+            )
+            self._method_not_allowed_responses[allowed_methods] = response
+        return response
+
+
+def split_path(path: str) -> list[str]:
+    return path[1:-1].split("/")
+
+
+def _match_node(
+    node: RouteNode,
+    parts: list[str],
+    index: int,
+    params: dict[str, Any],
+    method: str,
+) -> RouteNode | None:
+    if index == len(parts):
+        return node if method in node.routes else None
+
+    part = parts[index]
+
+    # Static segments take precedence over path parameters
+    if (child := node.static.get(part)) is not None:
+        found = _match_node(child, parts, index + 1, params, method)
+        if found is not None:
+            return found
+
+    if not part:
+        return None
+
+    for child in node.params.values():
+        name, converter = child.param  # pyright: ignore[reportOptionalIterable]
+        for end in _param_ends(converter, parts, index):
+            try:
+                params[name] = converter.convert("/".join(parts[index:end]))
+            except ValueError:
+                continue
+            found = _match_node(child, parts, end, params, method)
+            if found is not None:
+                return found
+            del params[name]
+
+    return None
+
+
+def _collect_methods(
+    node: RouteNode,
+    parts: list[str],
+    index: int,
+    methods: dict[str, None],
+) -> None:
+    if index == len(parts):
+        methods.update(dict.fromkeys(node.routes))
+        return
+
+    part = parts[index]
+
+    if (child := node.static.get(part)) is not None:
+        _collect_methods(child, parts, index + 1, methods)
+
+    if not part:
+        return
+
+    for child in node.params.values():
+        _, converter = child.param  # pyright: ignore[reportOptionalIterable]
+        for end in _param_ends(converter, parts, index):
+            try:
+                converter.convert("/".join(parts[index:end]))
+            except ValueError:
+                continue
+            _collect_methods(child, parts, end, methods)
+
+
+def _param_ends(
+    converter: Converter, parts: list[str], index: int
+) -> Iterable[int]:
+    # The path converter is greedy and gives segments back one at a time
+    if isinstance(converter, PathConverter):
+        return range(len(parts), index, -1)
+    return (index + 1,)
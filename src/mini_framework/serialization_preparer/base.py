@@ -1,10 +1,12 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
+from mini_framework.responses import ResponseStrategy
+
 
 class SerializationPreparer(ABC):
     @abstractmethod
     def prepare_response(
-        self, obj: Any, return_type: type, /
+        self, obj: Any, return_type: type, strategy: ResponseStrategy, /
     ) -> Any:  # pragma: no cover
         raise NotImplementedError
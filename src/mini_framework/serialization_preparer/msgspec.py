@@ -0,0 +1,32 @@
+from typing import Any
+
+from mini_framework.responses import Response, ResponseStrategy
+from mini_framework.serialization_preparer.base import SerializationPreparer
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+class MsgspecSerializationPreparer(SerializationPreparer):
+    def __init__(self) -> None:
+        assert msgspec is not None, "msgspec must be installed"
+        self._encoder = msgspec.json.Encoder()
+
+    def prepare_response(
+        self, obj: Any, return_type: type, strategy: ResponseStrategy, /
+    ) -> Any:
+        if strategy is not ResponseStrategy.MODEL and isinstance(
+            obj, Response
+        ):
+            # Encoded content, e.g. of a PreparedResponse, is left as is
+            if not isinstance(obj.content, bytes):
+                obj.content = msgspec.to_builtins(  # pyright: ignore[reportOptionalMemberAccess]
+                    obj.content, builtin_types=(bytearray,)
+                )
+            return obj
+        # Strings are left for the response class to render as it sees fit
+        if isinstance(obj, str):
+            return obj
+        return self._encoder.encode(obj)
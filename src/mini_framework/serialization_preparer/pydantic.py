@@ -1,18 +1,26 @@
-import inspect
-from typing import Any
+from typing import Any, Literal
 
-from pydantic_core import to_jsonable_python
+from pydantic_core import to_json, to_jsonable_python
 
-from mini_framework.responses import Response
+from mini_framework.responses import Response, ResponseStrategy
 from mini_framework.serialization_preparer.base import SerializationPreparer
 
 
 class PydanticSerializationPreparer(SerializationPreparer):
-    def prepare_response(self, obj: Any, return_type: type, /) -> Any:
-        if inspect.isclass(return_type) and (
-            issubclass(return_type, Response) or return_type is Any
+    def __init__(self, *, mode: Literal["python", "json"] = "python") -> None:
+        self._mode = mode
+
+    def prepare_response(
+        self, obj: Any, return_type: type, strategy: ResponseStrategy, /
+    ) -> Any:
+        if strategy is not ResponseStrategy.MODEL and isinstance(
+            obj, Response
         ):
-            if isinstance(obj, Response):
+            # Encoded content, e.g. of a PreparedResponse, is left as is
+            if not isinstance(obj.content, bytes):
                 obj.content = to_jsonable_python(obj.content)
-                return obj
+            return obj
+        # Strings are left for the response class to render as it sees fit
+        if self._mode == "json" and not isinstance(obj, str):
+            return to_json(obj)
         return to_jsonable_python(obj)
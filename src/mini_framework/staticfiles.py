@@ -1,7 +1,18 @@
+import os
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from email.utils import parsedate
+from pathlib import Path
+from threading import Lock
 
 from mini_framework.request import Request
-from mini_framework.responses import Response
+from mini_framework.responses import FileResponse, PreparedResponse, Response
+
+RANGE_SPEC_PATTERN = re.compile(r"(\d*)-(\d*)")
+# Requests for more ranges are answered with the whole file
+MAX_RANGES = 100
 
 
 def is_not_modified(request: Request, response: Response) -> bool:
@@ -21,3 +32,185 @@ def is_not_modified(request: Request, response: Response) -> bool:
         and last_modified is not None
         and if_modified_since >= last_modified
     )
+
+
+def get_ranges(
+    request: Request, response: FileResponse
+) -> list[tuple[int, int]] | None:
+    range_header = request.headers.get("range")
+    if range_header is None:
+        return None
+
+    # The whole file is sent when it has changed since the client cached it
+    if_range = request.headers.get("if-range")
+    if if_range is not None and not _if_range_matches(if_range, response):
+        return None
+
+    return parse_range_header(range_header, response.stat_result.st_size)
+
+
+def parse_range_header(
+    range_header: str, size: int
+) -> list[tuple[int, int]] | None:
+    # Returns None for a header that must be ignored and an empty list
+    # when none of the ranges can be satisfied
+    unit, _, specs = range_header.partition("=")
+    if unit.strip().lower() != "bytes":
+        return None
+
+    range_specs = specs.split(",")
+    if len(range_specs) > MAX_RANGES:
+        return None
+
+    ranges: list[tuple[int, int]] = []
+
+    for spec in range_specs:
+        match = RANGE_SPEC_PATTERN.fullmatch(spec.strip())
+        if match is None:
+            return None
+        first, last = match.groups()
+        if not first:
+            if not last:
+                return None
+            suffix_length = int(last)
+            if suffix_length:
+                ranges.append((max(size - suffix_length, 0), size))
+        else:
+            start = int(first)
+            end = int(last) + 1 if last else size
+            if last and end <= start:
+                return None
+            if start < size:
+                ranges.append((start, min(end, size)))
+
+    # Overlapping and adjacent ranges are coalesced
+    ranges.sort()
+    merged: list[tuple[int, int]] = []
+    for start, end in ranges:
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _if_range_matches(if_range: str, response: FileResponse) -> bool:
+    if if_range.startswith("W/"):
+        return False
+    if if_range.startswith('"'):
+        return if_range == response.headers.get("etag")
+    return if_range == response.headers.get("last-modified")
+
+
+@dataclass(slots=True, kw_only=True)
+class _CacheEntry:
+    response: PreparedResponse
+    file_path: Path
+    mtime_ns: int
+    size: int
+    checked_at: float
+
+
+class StaticFilesCache:
+    __slots__ = (
+        "max_size",
+        "max_file_size",
+        "stat_interval",
+        "size",
+        "hits",
+        "misses",
+        "evictions",
+        "_entries",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 32 * 1024 * 1024,
+        max_file_size: int = 1024 * 1024,
+        stat_interval: float = 1.0,
+    ) -> None:
+        self.max_size = max_size
+        self.max_file_size = max_file_size
+        self.stat_interval = stat_interval
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Path, _CacheEntry] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, file_path: Path) -> PreparedResponse | None:
+        entry = self._entries.get(file_path)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        # The file is stat'ed at most once per interval to notice changes
+        now = time.monotonic()
+        if now - entry.checked_at >= self.stat_interval:
+            try:
+                stat_result = os.stat(entry.file_path)
+            except OSError:
+                stat_result = None
+            if stat_result is None or (
+                stat_result.st_mtime_ns != entry.mtime_ns
+                or stat_result.st_size != entry.size
+            ):
+                self._discard(entry)
+                self.misses += 1
+                return None
+            entry.checked_at = now
+
+        with self._lock:
+            if file_path in self._entries:
+                self._entries.move_to_end(file_path)
+        self.hits += 1
+        return entry.response
+
+    def put(self, response: FileResponse) -> None:
+        stat_result = response.stat_result
+        if stat_result.st_size > min(self.max_file_size, self.max_size):
+            return
+
+        with open(response.path, mode="rb") as file:
+            content = file.read()
+        # The file changed while it was being read
+        if len(content) != stat_result.st_size:
+            return
+
+        entry = _CacheEntry(
+            response=PreparedResponse(
+                Response(
+                    content=content,
+                    headers=response.headers,
+                    media_type=response.media_type,
+                    charset=response.charset,
+                )
+            ),
+            file_path=Path(response.path),
+            mtime_ns=stat_result.st_mtime_ns,
+            size=stat_result.st_size,
+            checked_at=time.monotonic(),
+        )
+
+        with self._lock:
+            old_entry = self._entries.pop(entry.file_path, None)
+            if old_entry is not None:
+                self.size -= old_entry.size
+            self._entries[entry.file_path] = entry
+            self.size += entry.size
+            while self.size > self.max_size:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= evicted.size
+                self.evictions += 1
+
+    def _discard(self, entry: _CacheEntry) -> None:
+        with self._lock:
+            if self._entries.get(entry.file_path) is entry:
+                del self._entries[entry.file_path]
+                self.size -= entry.size
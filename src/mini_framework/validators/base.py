@@ -1,5 +1,13 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Iterable
+from typing import Any, TYPE_CHECKING
+
+from mini_framework.exceptions import RequestValidationError
+
+if TYPE_CHECKING:
+    from mini_framework.request import Request
 
 
 class Validator(ABC):
@@ -14,3 +22,26 @@ class Validator(ABC):
         self, obj: Any, return_type: type, /
     ) -> Any:  # pragma: no cover
         raise NotImplementedError
+
+    def validate_request_body(
+        self, request: Request, model: Any, name: str, /
+    ) -> Any:
+        try:
+            obj = request.json()
+        except ValueError as e:
+            raise RequestValidationError(
+                [
+                    {
+                        "type": "json_invalid",
+                        "loc": (name,),
+                        "msg": f"Invalid JSON: {e}",
+                        "input": request.body.decode(errors="replace"),
+                    }
+                ],
+                params=request.body,
+                expected_type=model,
+            ) from None
+        return self.validate_request(obj, model)
+
+    def warm_up(self, types: Iterable[Any], /) -> None:
+        pass
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import cache
+from typing import Any, TYPE_CHECKING
+
+from mini_framework.validators.base import Validator
+from mini_framework.exceptions import (
+    ResponseValidationError,
+    RequestValidationError,
+)
+
+if TYPE_CHECKING:
+    from mini_framework.request import Request
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+class MsgspecValidator(Validator):
+    def __init__(self) -> None:
+        assert msgspec is not None, "msgspec must be installed"
+
+    def validate_request(self, params: dict[str, Any], model: type, /) -> Any:
+        try:
+            return msgspec.convert(  # pyright: ignore[reportOptionalMemberAccess]
+                params, model, strict=False, dec_hook=_dec_hook
+            )
+        except msgspec.ValidationError as e:  # pyright: ignore[reportOptionalMemberAccess]
+            raise RequestValidationError(
+                str(e), params=params, expected_type=model
+            )
+
+    def validate_request_body(
+        self, request: Request, model: Any, name: str, /
+    ) -> Any:
+        try:
+            return _get_decoder(model).decode(request.body)
+        except msgspec.DecodeError as e:  # pyright: ignore[reportOptionalMemberAccess]
+            raise RequestValidationError(
+                str(e), params=request.body, expected_type=model
+            )
+
+    def validate_response(self, obj: Any, return_type: type, /) -> Any:
+        try:
+            return msgspec.convert(  # pyright: ignore[reportOptionalMemberAccess]
+                obj, return_type, strict=False, dec_hook=_dec_hook
+            )
+        except msgspec.ValidationError as e:  # pyright: ignore[reportOptionalMemberAccess]
+            raise ResponseValidationError(
+                str(e), value=obj, expected_type=return_type
+            )
+
+    def warm_up(self, types: Iterable[Any], /) -> None:
+        for type_ in types:
+            _get_decoder(type_)
+
+
+def _dec_hook(type_: type, obj: Any) -> Any:
+    # Types msgspec does not know (e.g. UploadFile) are only type checked
+    if isinstance(obj, type_):
+        return obj
+    raise TypeError(f"Expected {type_.__name__}")
+
+
+@cache
+def _get_decoder(type_: Any) -> Any:
+    return msgspec.json.Decoder(type_, strict=False, dec_hook=_dec_hook)  # pyright: ignore[reportOptionalMemberAccess]
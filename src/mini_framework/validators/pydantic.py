@@ -1,17 +1,21 @@
-import inspect
+from __future__ import annotations
+
+from collections.abc import Iterable
 from dataclasses import is_dataclass
 from functools import cache
-from typing import Any
+from typing import Any, TYPE_CHECKING
 
 from pydantic import TypeAdapter, ValidationError, ConfigDict
 
-from mini_framework.responses import Response
 from mini_framework.validators.base import Validator
 from mini_framework.exceptions import (
     ResponseValidationError,
     RequestValidationError,
 )
 
+if TYPE_CHECKING:
+    from mini_framework.request import Request
+
 
 class PydanticValidator(Validator):
     def validate_request(self, params: dict[str, Any], model: type, /) -> Any:
@@ -26,12 +30,24 @@ class PydanticValidator(Validator):
                 expected_type=model,
             )
 
-    def validate_response(self, obj: Any, return_type: type, /) -> Any:
-        if inspect.isclass(return_type) and (
-            issubclass(return_type, Response) or return_type is Any
-        ):
-            return obj
+    def validate_request_body(
+        self, request: Request, model: Any, name: str, /
+    ) -> Any:
+        adapter = _get_adapter(model)
+
+        try:
+            return adapter.validate_json(request.body)
+        except ValidationError as e:
+            raise RequestValidationError(
+                [
+                    _prefix_error(error, name)
+                    for error in e.errors(include_url=False)
+                ],
+                params=request.body,
+                expected_type=model,
+            )
 
+    def validate_response(self, obj: Any, return_type: type, /) -> Any:
         adapter = _get_adapter(return_type)
 
         try:
@@ -43,6 +59,18 @@ class PydanticValidator(Validator):
                 expected_type=return_type,
             )
 
+    def warm_up(self, types: Iterable[Any], /) -> None:
+        for type_ in types:
+            _get_adapter(type_)
+
+
+def _prefix_error(error: Any, name: str) -> Any:
+    error = {**error, "loc": (name, *error["loc"])}
+    # Malformed JSON reports the raw body as its input
+    if isinstance(error.get("input"), bytes):
+        error["input"] = error["input"].decode(errors="replace")
+    return error
+
 
 @cache
 def _get_adapter(type_: type) -> TypeAdapter:
@@ -1,8 +1,11 @@
 from typing import Any
 from unittest.mock import Mock
 
-from mini_framework import Application
+import pytest
+
+from mini_framework import Application, Response
 from mini_framework.middlewares.base import CallNext
+from mini_framework.responses import PlainTextResponse
 
 
 def test_di_via_middleware(app: Application, mocked_request: Mock) -> None:
@@ -79,3 +82,105 @@ def test_error_di_via_filter(app: Application, mocked_request: Mock) -> None:
         assert value == 0
 
     app.propagate(mocked_request)
+
+
+def test_di_data_does_not_leak_into_application(
+    app: Application, mocked_request: Mock
+) -> None:
+    app["some_data"] = "some_data"
+
+    @app.route.middleware
+    def middleware(call_next: CallNext, data: dict[str, Any]) -> None:
+        data["some_data"] = "overridden"
+        data["other_data"] = "other_data"
+        call_next(data)
+
+    @app.get("/")
+    def index(some_data: str, other_data: str) -> None:
+        assert some_data == "overridden"
+        assert other_data == "other_data"
+
+    app.propagate(mocked_request)
+
+    assert app["some_data"] == "some_data"
+    with pytest.raises(KeyError):
+        app["other_data"]
+
+
+def test_di_via_rejected_filter_is_discarded(
+    app: Application, mocked_request: Mock
+) -> None:
+    def filter() -> dict[str, int]:
+        return {"value": 0}
+
+    app.get("/", filter, lambda value: value == 1)(lambda: None)
+
+    @app.get("/")
+    def index(**kwargs: Any) -> None:
+        assert "value" not in kwargs
+
+    app.propagate(mocked_request)
+
+
+def test_injected_response_is_used(
+    app: Application, mocked_request: Mock
+) -> None:
+    @app.get("/", response_class=PlainTextResponse, status_code=201)
+    def index(response: Response) -> str:
+        response.headers["X-Custom"] = "value"
+        return "Hello, World!"
+
+    response = app.propagate(mocked_request)
+
+    assert isinstance(response, PlainTextResponse)
+    assert response.status_code == 201
+    assert response.headers["X-Custom"] == "value"
+    assert response.content == "Hello, World!"
+
+
+def test_response_is_created_lazily(
+    app: Application, mocked_request: Mock
+) -> None:
+    response_class = Mock(wraps=PlainTextResponse)
+
+    @app.get("/", response_class=response_class)
+    def index() -> PlainTextResponse:
+        return PlainTextResponse("Hello, World!")
+
+    response = app.propagate(mocked_request)
+
+    assert response.content == "Hello, World!"
+    response_class.assert_not_called()
+
+
+def test_response_is_passed_to_varkw(
+    app: Application, mocked_request: Mock
+) -> None:
+    @app.get("/", response_class=PlainTextResponse)
+    def index(**kwargs: Any) -> str:
+        kwargs["response"].headers["X-Custom"] = "value"
+        return "Hello, World!"
+
+    response = app.propagate(mocked_request)
+
+    assert response.headers["X-Custom"] == "value"
+    assert response.content == "Hello, World!"
+
+
+def test_response_is_passed_to_error_handler(
+    app: Application, mocked_request: Mock
+) -> None:
+    @app.get("/")
+    def index() -> None:
+        raise ValueError
+
+    @app.error()
+    def error(response: Response) -> Response:
+        response.status_code = 409
+        response.content = "handled"
+        return response
+
+    response = app.propagate(mocked_request)
+
+    assert response.status_code == 409
+    assert response.content == "handled"
@@ -1,11 +1,12 @@
 from http import HTTPStatus
 from typing import Any
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 
 from mini_framework import Application, Response
 from mini_framework.middlewares import BaseMiddleware
 from mini_framework.middlewares.base import CallNext
+from mini_framework.middlewares.manager import MiddlewareManager
 from mini_framework.responses import PlainTextResponse
 from mini_framework.routes.manager import SkipRoute, UNHANDLED
 from mini_framework.routes.route import Route
@@ -135,3 +136,35 @@ def test_skip_route_in_middleware(
     response = app.propagate(mocked_request)
 
     assert response is UNHANDLED
+
+
+def test_middleware_chains_are_composed_once(
+    app: Application, mocked_request: Mock
+) -> None:
+    @app.route.middleware
+    def middleware(call_next: CallNext, data: dict[str, Any]) -> Any:
+        return call_next(data)
+
+    @app.get("/")
+    def index() -> str:
+        return "Hello, World!"
+
+    app.compile()
+
+    with patch.object(MiddlewareManager, "wrap_middlewares") as wrap:
+        response = app.propagate(mocked_request)
+
+    assert response.content == "Hello, World!"
+    wrap.assert_not_called()
+
+
+def test_wrap_middlewares_passes_data_as_kwargs() -> None:
+    callback = Mock(return_value="Hello, World!")
+
+    def middleware(call_next: CallNext, data: dict[str, Any]) -> Any:
+        return call_next({**data, "age": 20})
+
+    wrapped = MiddlewareManager.wrap_middlewares([middleware], callback)
+
+    assert wrapped({"name": "John"}) == "Hello, World!"
+    callback.assert_called_once_with(name="John", age=20)
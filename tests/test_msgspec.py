@@ -0,0 +1,158 @@
+from typing import Annotated
+from unittest.mock import Mock
+
+import pytest
+
+from mini_framework import Application
+from mini_framework.exceptions import ResponseValidationError
+from mini_framework.params import BodyModel, Query
+from mini_framework.responses import JSONResponse
+from mini_framework.serialization_preparer.msgspec import (
+    MsgspecSerializationPreparer,
+)
+from mini_framework.validators.msgspec import MsgspecValidator
+
+msgspec = pytest.importorskip("msgspec")
+
+
+class User(msgspec.Struct, frozen=True):
+    name: str
+    age: int
+
+
+@pytest.fixture()
+def app() -> Application:
+    return Application(
+        validator=MsgspecValidator(),
+        serialization_preparer=MsgspecSerializationPreparer(),
+    )
+
+
+def test_struct_return_annotation(
+    app: Application, mocked_request: Mock
+) -> None:
+    mocked_request.query_params = {"name": "John", "age": "20"}
+
+    @app.get("/")
+    def index(
+        name: Annotated[str, Query()], age: Annotated[int, Query()]
+    ) -> User:
+        return User(name=name, age=age)
+
+    response = app.propagate(mocked_request)
+
+    assert response.content == b'{"name":"John","age":20}'
+    assert response.render() == b'{"name":"John","age":20}'
+
+
+def test_response_model(app: Application, mocked_request: Mock) -> None:
+    @app.get("/", response_model=User)
+    def index():
+        return {"name": "John", "age": 20, "password": "secret"}
+
+    response = app.propagate(mocked_request)
+
+    assert response.render() == b'{"name":"John","age":20}'
+
+
+def test_invalid_response(app: Application, mocked_request: Mock) -> None:
+    @app.get("/")
+    def index() -> User:
+        return {"name": "John"}  # pyright: ignore[reportReturnType]
+
+    with pytest.raises(ResponseValidationError):
+        app.propagate(mocked_request)
+
+
+def test_invalid_query_param(app: Application, mocked_request: Mock) -> None:
+    mocked_request.query_params = {"age": "17"}
+
+    @app.get("/")
+    def index(age: Annotated[int, Query(), msgspec.Meta(ge=18)]):
+        assert False  # noqa: B011
+
+    response = app.propagate(mocked_request)
+
+    assert response.status_code == 422
+    assert response.content == {"detail": "Expected `int` >= 18 - at `$.age`"}
+
+
+def test_unparsable_query_param(
+    app: Application, mocked_request: Mock
+) -> None:
+    mocked_request.query_params = {"age": "twenty"}
+
+    @app.get("/")
+    def index(age: Annotated[int, Query()]):
+        assert False  # noqa: B011
+
+    response = app.propagate(mocked_request)
+
+    assert response.status_code == 422
+    assert response.content == {
+        "detail": "Expected `int`, got `str` - at `$.age`"
+    }
+
+
+def test_body_model_decoded_from_raw_body(
+    app: Application, mocked_request: Mock
+) -> None:
+    mocked_request.body = b'{"name": "John", "age": 20}'
+
+    @app.post("/")
+    def index(user: Annotated[User, BodyModel()]) -> User:
+        return user
+
+    mocked_request.method = "POST"
+
+    response = app.propagate(mocked_request)
+
+    assert response.render() == b'{"name":"John","age":20}'
+    mocked_request.json.assert_not_called()
+
+
+def test_body_model_invalid_json(
+    app: Application, mocked_request: Mock
+) -> None:
+    mocked_request.method = "POST"
+    mocked_request.body = b"{"
+
+    @app.post("/")
+    def index(user: Annotated[User, BodyModel()]):
+        assert False  # noqa: B011
+
+    response = app.propagate(mocked_request)
+
+    assert response.status_code == 422
+
+
+def test_returned_response_content_is_converted(
+    app: Application, mocked_request: Mock
+) -> None:
+    @app.get("/")
+    def index() -> JSONResponse:
+        return JSONResponse({"user": User(name="John", age=20)})
+
+    response = app.propagate(mocked_request)
+
+    assert response.content == {"user": {"name": "John", "age": 20}}
+
+
+def test_string_is_left_to_response_class(
+    app: Application, mocked_request: Mock
+) -> None:
+    @app.get("/")
+    def index() -> str:
+        return "John"
+
+    response = app.propagate(mocked_request)
+
+    assert response.render() == b'"John"'
+
+
+def test_warm_up(app: Application) -> None:
+    @app.post("/")
+    def index(user: Annotated[User, BodyModel()]) -> User:
+        return user
+
+    assert app.warm_up() >= 0
@@ -18,6 +18,7 @@ import pytest
 
 import mini_framework.request
 from mini_framework.request import (
+    Headers,
     extract_headers,
     extract_path_params,
     extract_path_params_from_template,
@@ -132,6 +133,18 @@ def test_extract_path_params(
             [],
             pytest.raises(ValueError, match="Invalid path"),
         ),
+        (
+            "/users/{user_id:int}/files/{path:path}/",
+            ["user_id", "path"],
+            nullcontext(),
+        ),
+        (
+            "/users/{user_id:integer}/",
+            [],
+            pytest.raises(
+                ValueError, match="Unknown path converter 'integer'"
+            ),
+        ),
     ],
 )
 def test_extract_path_params_from_template(
@@ -372,3 +385,82 @@ def test_host_url(
     request = Request(app, environ, path_params=path_params)
 
     assert request.host_url == expected_host_url
+
+
+def test_form_fields_by_name(app: Application) -> None:
+    environ = {
+        "wsgi.input": BytesIO(b"a=1&b=2&a=3"),
+        "HTTP_CONTENT_TYPE": "application/x-www-form-urlencoded",
+    }
+    request = Request(app, environ, path_params={})
+
+    form = request.form()
+
+    assert [field.value for field in form.get_fields("a")] == [b"1", b"3"]
+    assert [field.value for field in form.get_fields("b")] == [b"2"]
+    assert form.get_fields("c") == []
+    assert form.get_files("a") == []
+
+
+@pytest.mark.parametrize(
+    "environ, key, expected_value",
+    [
+        ({"HTTP_IF_NONE_MATCH": '"etag"'}, "If-None-Match", '"etag"'),
+        ({"HTTP_IF_NONE_MATCH": '"etag"'}, "if-none-match", '"etag"'),
+        (
+            {"HTTP_AUTHORIZATION": "Bearer token"},
+            "authorization",
+            "Bearer token",
+        ),
+        ({"CONTENT_TYPE": "text/plain"}, "Content-Type", "text/plain"),
+        ({"HTTP_CONTENT_TYPE": "text/plain"}, "content-type", "text/plain"),
+        ({"CONTENT_LENGTH": "13"}, "Content-Length", "13"),
+        ({}, "Host", None),
+    ],
+)
+def test_headers_lookup(
+    environ: WSGIEnvironment, key: str, expected_value: str | None
+) -> None:
+    headers = Headers(environ)
+
+    assert headers.get(key) == expected_value
+    assert headers._headers is None
+
+
+def test_headers_iteration() -> None:
+    headers = Headers(
+        {
+            "PATH_INFO": "/",
+            "HTTP_HOST": "localhost:8000",
+            "CONTENT_TYPE": "text/plain",
+        }
+    )
+
+    assert dict(headers.items()) == {
+        "Host": "localhost:8000",
+        "Content-Type": "text/plain",
+    }
+    assert len(headers) == 2
+    assert "host" in headers
+
+
+def test_headers_multidict_api() -> None:
+    headers = Headers({"HTTP_ACCEPT": "text/html"})
+
+    assert headers.getone("accept") == "text/html"
+    assert headers.getall("accept") == ["text/html"]
+    assert headers.getall("host", []) == []
+    with pytest.raises(KeyError):
+        headers.getall("host")
+    with pytest.raises(KeyError):
+        headers.getone("host")
+
+
+def test_headers_lookup_rejects_underscores() -> None:
+    headers = Headers({"HTTP_USER_AGENT": "curl"})
+
+    assert headers.get("user-agent") == "curl"
+    assert headers.get("user_agent") is None
+    assert "user_agent" not in headers
+    assert list(headers) == ["User-Agent"]
+    assert headers.get("user_agent") is None
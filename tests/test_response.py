@@ -1,11 +1,13 @@
 import itertools
 import re
+from collections.abc import Callable
 from contextlib import AbstractContextManager, nullcontext
 from datetime import datetime, timedelta, UTC
 from email.utils import format_datetime
 from http import HTTPStatus
 from pathlib import Path
 from unittest.mock import Mock
+from wsgiref.util import FileWrapper
 
 import pytest
 
@@ -15,6 +17,13 @@ from mini_framework.responses import (
     get_status_code_and_phrase,
     PlainTextResponse,
     FileResponse,
+    JSONResponse,
+    PreparedResponse,
+    prepare_headers,
+)
+from mini_framework.datastructures import ResponseHeaders
+from mini_framework.serialization_preparer.pydantic import (
+    PydanticSerializationPreparer,
 )
 
 
@@ -34,6 +43,75 @@ def test_render_response(
     assert response.render() == expected_rendered_response
 
 
+@pytest.mark.parametrize(
+    "content, expected_rendered_response",
+    [
+        ({"name": "Jöhn"}, '{"name":"Jöhn"}'.encode()),
+        (b'{"name": "John"}', b'{"name": "John"}'),
+    ],
+)
+def test_render_json_response(
+    content: object, expected_rendered_response: bytes
+) -> None:
+    response = JSONResponse(content)
+
+    assert response.render() == expected_rendered_response
+
+
+@pytest.mark.parametrize(
+    "json_dumps", [lambda obj: "dumped", lambda obj: b"dumped"]
+)
+def test_render_json_response_with_json_dumps(
+    json_dumps: Callable[[object], bytes | str],
+) -> None:
+    response = JSONResponse({"name": "John"}, json_dumps=json_dumps)
+
+    assert response.render() == b"dumped"
+
+
+def test_app_json_dumps(mocked_request: Mock) -> None:
+    json_dumps = Mock(return_value=b"dumped")
+    app = Application(json_dumps=json_dumps)
+
+    @app.get("/")
+    def index():
+        return {"name": "John"}
+
+    response = app.propagate(mocked_request)
+
+    assert response.render() == b"dumped"
+    json_dumps.assert_called_once_with({"name": "John"})
+
+
+def test_app_json_dumps_does_not_override_response_json_dumps(
+    mocked_request: Mock,
+) -> None:
+    app = Application(json_dumps=Mock(return_value=b"app"))
+
+    @app.get("/")
+    def index():
+        return JSONResponse({}, json_dumps=lambda obj: b"response")
+
+    response = app.propagate(mocked_request)
+
+    assert response.render() == b"response"
+
+
+def test_serialization_preparer_json_mode(mocked_request: Mock) -> None:
+    app = Application(
+        serialization_preparer=PydanticSerializationPreparer(mode="json")
+    )
+
+    @app.get("/")
+    def index() -> dict[str, datetime]:
+        return {"created_at": datetime(2024, 1, 1, tzinfo=UTC)}
+
+    response = app.propagate(mocked_request)
+
+    assert response.content == b'{"created_at":"2024-01-01T00:00:00Z"}'
+    assert response.render() is response.content
+
+
 def test_status_code(app: Application, mocked_request: Mock) -> None:
     @app.get("/")
     def index():
@@ -177,6 +255,25 @@ def test_iter_content(file: Path) -> None:
     assert content == b"Hello, World!"
 
 
+def test_iter_wsgi_uses_file_wrapper(file: Path) -> None:
+    file.write_text("Hello, World!")
+    response = FileResponse(file)
+
+    iterable = response.iter_wsgi({"wsgi.file_wrapper": FileWrapper})
+
+    assert isinstance(iterable, FileWrapper)
+    assert iterable.blksize == response.chunk_size
+    assert b"".join(iterable) == b"Hello, World!"
+    iterable.close()
+
+
+def test_iter_wsgi_without_file_wrapper(file: Path) -> None:
+    file.write_text("Hello, World!")
+    response = FileResponse(file)
+
+    assert b"".join(response.iter_wsgi({})) == b"Hello, World!"
+
+
 def test_set_cookie_with_expires() -> None:
     response = Response(content=None)
     expires = datetime.now(UTC) + timedelta(hours=1)
@@ -209,3 +306,121 @@ def test_set_cookie_with_secure() -> None:
     expected_cookie = "name=John; Path=/; SameSite=lax; Secure"
 
     assert response.headers["Set-Cookie"] == expected_cookie
+
+
+def test_prepared_response() -> None:
+    response = PreparedResponse(
+        JSONResponse(
+            {"detail": "Gone"},
+            status_code=HTTPStatus.GONE,
+            headers={"X-Custom": "value"},
+        )
+    )
+
+    assert response.status_line == "410 Gone"
+    assert response.body == b'{"detail":"Gone"}'
+    assert response.render() is response.body
+    assert response.raw_headers == [
+        ("X-Custom", "value"),
+        ("Content-Type", "application/json; charset=utf-8"),
+        ("Content-Length", "17"),
+    ]
+    assert response.headers["x-custom"] == "value"
+
+
+def test_prepared_response_is_immutable() -> None:
+    response = PreparedResponse(PlainTextResponse("Hello, World!"))
+
+    with pytest.raises(AttributeError):
+        response.content = b"Bye!"
+
+    with pytest.raises(TypeError):
+        response.headers["X-Custom"] = "value"  # pyright: ignore[reportIndexIssue]
+
+
+def test_prepared_response_copy() -> None:
+    prepared = PreparedResponse(
+        PlainTextResponse("Hello, World!", headers={"X-Custom": "value"})
+    )
+
+    response = prepared.copy()
+    response.headers["X-Frame-Options"] = "DENY"
+
+    assert type(response) is Response
+    assert response.render() == b"Hello, World!"
+    assert response.headers.raw == [
+        ("X-Custom", "value"),
+        ("Content-Type", "text/plain; charset=utf-8"),
+        ("X-Frame-Options", "DENY"),
+    ]
+    assert "X-Frame-Options" not in prepared.headers
+
+
+def test_prepared_response_rejects_streamed_content(file: Path) -> None:
+    with pytest.raises(TypeError):
+        PreparedResponse(FileResponse(file))
+
+
+def test_return_prepared_response(app: Application) -> None:
+    prepared = PreparedResponse(
+        PlainTextResponse("Hello, World!", status_code=HTTPStatus.ACCEPTED)
+    )
+
+    @app.get("/")
+    def index() -> PreparedResponse:
+        return prepared
+
+    start_response = Mock()
+
+    body = app({"PATH_INFO": "/", "REQUEST_METHOD": "GET"}, start_response)
+
+    assert body == (b"Hello, World!",)
+    start_response.assert_called_once_with(
+        "202 Accepted", prepared.raw_headers
+    )
+
+
+def test_response_headers() -> None:
+    headers = ResponseHeaders({"X-Custom": "value"})
+    headers.add("Set-Cookie", "a=1")
+    headers.add("set-cookie", "b=2")
+
+    assert headers["x-custom"] == "value"
+    assert "SET-COOKIE" in headers
+    assert "X-Missing" not in headers
+    assert headers.get("X-Missing") is None
+    assert headers.getall("Set-Cookie") == ["a=1", "b=2"]
+    assert len(headers) == 3
+
+    headers["Set-Cookie"] = "c=3"
+
+    assert headers.items() == [("X-Custom", "value"), ("Set-Cookie", "c=3")]
+
+    assert headers.setdefault("x-custom", "other") == "value"
+    del headers["X-CUSTOM"]
+
+    assert headers.raw == [("Set-Cookie", "c=3")]
+    with pytest.raises(KeyError):
+        headers["X-Custom"]
+    with pytest.raises(KeyError):
+        del headers["X-Custom"]
+
+
+def test_prepare_headers_keeps_explicit_headers() -> None:
+    response = PlainTextResponse(
+        "Hello, World!",
+        headers={"content-type": "text/csv", "content-length": "13"},
+    )
+
+    assert prepare_headers(response, response.render()) == [
+        ("content-type", "text/csv"),
+        ("content-length", "13"),
+    ]
+
+
+def test_prepare_headers_without_media_type() -> None:
+    response = Response(content=None, status_code=HTTPStatus.NO_CONTENT)
+
+    assert prepare_headers(response, response.render()) == [
+        ("Content-Length", "0")
+    ]
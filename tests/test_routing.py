@@ -1,12 +1,24 @@
 from collections.abc import Callable
 from contextlib import AbstractContextManager, nullcontext
 from http import HTTPMethod
+from io import BytesIO
+from typing import Annotated, Any
+from uuid import UUID
 from unittest.mock import Mock, create_autospec
 
+from multidict import CIMultiDict
 from multipart.multipart import File
 
 from mini_framework.datastructures import FormData, UploadFile
-from mini_framework.routes.params_resolvers import _resolve_upload_file_params
+from mini_framework.middlewares.base import CallNext
+from mini_framework.params import Cookie, Header, Path, Query
+from mini_framework.routes.params_resolvers import (
+    _resolve_file_params,
+    _resolve_path_params,
+    _resolve_query_params,
+    _resolve_upload_file_params,
+    resolve_params,
+)
 from mini_framework.routes.route import Route, NoMatchFound
 
 try:
@@ -15,11 +27,17 @@ except ImportError:
     multipart = None
 
 import pytest
+from annotated_types import Gt
 
 from mini_framework import Application, Router
-from mini_framework.responses import PlainTextResponse
+from mini_framework.responses import (
+    PlainTextResponse,
+    Response,
+    ResponseStrategy,
+)
 from mini_framework.routes.manager import SkipRoute, UNHANDLED
 from mini_framework.routes.route import CallableObject
+from mini_framework.validators.pydantic import PydanticValidator
 
 METHODS: list[str] = [
     method for method in HTTPMethod if method != HTTPMethod.CONNECT
@@ -196,11 +214,7 @@ def test_skip_route(app: Application, mocked_request: Mock) -> None:
     assert response is UNHANDLED
 
 
-def test_get_routers_and_routes(
-    app: Application, mocked_request: Mock
-) -> None:
-    mocked_request.path_params = {}
-
+def test_get_routers_and_routes(app: Application) -> None:
     router1 = Router()
     router2 = Router()
     router3 = Router()
@@ -215,12 +229,13 @@ def test_get_routers_and_routes(
     app.include_router(router2)
     app.include_router(router3)
 
-    routers_and_routes = list(
-        app._get_matching_routers_and_routes(mocked_request)
-    )
+    match = app.route_tree.lookup(HTTPMethod.GET, "/")
+
+    assert match is not None
+    assert match.path_params == {}
 
     routers_and_callbacks = [
-        (router, route.callback) for router, route in routers_and_routes
+        (plan.router, plan.route.callback) for plan in match.candidates
     ]
 
     assert routers_and_callbacks == [
@@ -238,11 +253,8 @@ def test_get_routers_and_routes(
     ],
 )
 def test_get_routers_not_found(
-    app: Application, mocked_request: Mock, path: str, method: str
+    app: Application, path: str, method: str
 ) -> None:
-    mocked_request.path = path
-    mocked_request.method = method
-
     router1 = Router()
     router2 = Router()
 
@@ -251,11 +263,7 @@ def test_get_routers_not_found(
     app.include_router(router1)
     app.include_router(router2)
 
-    routers_and_routes = list(
-        app._get_matching_routers_and_routes(mocked_request)
-    )
-
-    assert routers_and_routes == []
+    assert app.route_tree.lookup(method, path) is None
 
 
 def test_multiple_routers_propagation(
@@ -341,6 +349,28 @@ def test_resolve_upload_file_params_missing_one_file(
     assert params["upload_file_1"].file is file.file_object
 
 
+def test_resolve_file_params_takes_last_file(
+    mocked_request: Mock, route: Route
+) -> None:
+    files = []
+    for field_name, content in (
+        (b"file", b"first"),
+        (b"other", b"other"),
+        (b"file", b"last"),
+    ):
+        file = create_autospec(File, field_name=field_name)
+        file.file_object = BytesIO(content)
+        file.file_object.read()
+        files.append(file)
+    mocked_request.form.return_value = FormData(fields=[], files=files)
+    route.files = {"file"}
+    params = {}
+
+    _resolve_file_params(route, mocked_request, params=params)
+
+    assert params == {"file": b"last"}
+
+
 def test_url_path(app: Application) -> None:
     @app.get("/")
     def index():
@@ -389,3 +419,414 @@ def test_url_path_with_path_params(
 
     with contextmanager:
         assert app.url_path_for("items", **path_params) == "/items/apple/1/"
+
+
+@pytest.mark.parametrize(
+    "path, expected_path, expected_path_params",
+    [
+        ("/", "/", {}),
+        ("/users/", "/users/", {}),
+        ("/users/me/", "/users/me/", {}),
+        ("/users/1/", "/users/{id}/", {"id": "1"}),
+        ("/users/me/posts/", "/users/{id}/posts/", {"id": "me"}),
+        (
+            "/users/1/posts/2/",
+            "/users/{id}/posts/{post_id}/",
+            {"id": "1", "post_id": "2"},
+        ),
+    ],
+)
+def test_route_tree_lookup(
+    app: Application,
+    path: str,
+    expected_path: str,
+    expected_path_params: dict[str, str],
+) -> None:
+    for route_path in [
+        "/",
+        "/users/{id}/",
+        "/users/",
+        "/users/me/",
+        "/users/{id}/posts/",
+        "/users/{id}/posts/{post_id}/",
+    ]:
+        app.get(route_path)(lambda: None)
+    tree = app.route_tree
+
+    match = tree.lookup(HTTPMethod.GET, path)
+
+    assert match is not None
+    assert match.path == expected_path
+    assert match.path_params == expected_path_params
+    assert [plan.route.path for plan in match.candidates] == [expected_path]
+
+
+@pytest.mark.parametrize(
+    "path", ["/users//", "/users/1/comments/", "/unknown/"]
+)
+def test_route_tree_lookup_not_found(app: Application, path: str) -> None:
+    app.get("/users/")(lambda: None)
+    app.get("/users/{id}/")(lambda: None)
+    tree = app.route_tree
+
+    assert tree.lookup(HTTPMethod.GET, path) is None
+
+
+def test_route_tree_invalidated_on_register(app: Application) -> None:
+    router = Router()
+    app.include_router(router)
+
+    assert app.route_tree.lookup(HTTPMethod.GET, "/users/") is None
+
+    router.get("/users/")(lambda: None)
+
+    assert app.route_tree.lookup(HTTPMethod.GET, "/users/") is not None
+
+
+def test_route_tree_invalidated_on_include_router(app: Application) -> None:
+    router = Router()
+    router.get("/users/")(lambda: None)
+
+    assert app.route_tree.lookup(HTTPMethod.GET, "/users/") is None
+
+    app.include_router(router)
+
+    assert app.route_tree.lookup(HTTPMethod.GET, "/users/") is not None
+
+
+def test_route_tree_lookup_prefers_route_with_method(
+    app: Application,
+) -> None:
+    app.post("/users/me/")(lambda: None)
+    app.get("/users/{id}/")(lambda: None)
+    tree = app.route_tree
+
+    match = tree.lookup(HTTPMethod.GET, "/users/me/")
+
+    assert match is not None
+    assert match.path == "/users/{id}/"
+    assert match.path_params == {"id": "me"}
+
+
+@pytest.mark.parametrize(
+    "path, expected_allowed_methods",
+    [
+        ("/users/", (HTTPMethod.GET, HTTPMethod.POST)),
+        ("/users/me/", (HTTPMethod.DELETE, HTTPMethod.PUT)),
+        ("/users/1/", (HTTPMethod.PUT,)),
+        ("/unknown/", ()),
+    ],
+)
+def test_route_tree_allowed_methods(
+    app: Application, path: str, expected_allowed_methods: tuple[str, ...]
+) -> None:
+    app.get("/users/")(lambda: None)
+    app.post("/users/")(lambda: None)
+    app.delete("/users/me/")(lambda: None)
+    app.put("/users/{id}/")(lambda: None)
+    tree = app.route_tree
+
+    assert tree.allowed_methods(path) == expected_allowed_methods
+
+
+def test_method_not_allowed(app: Application) -> None:
+    app.get("/")(lambda: None)
+    app.post("/")(lambda: None)
+    start_response = Mock()
+
+    body = app({"PATH_INFO": "/", "REQUEST_METHOD": "PUT"}, start_response)
+
+    start_response.assert_called_once()
+    status, headers = start_response.call_args.args
+    assert status == "405 Method Not Allowed"
+    assert ("Allow", "GET, POST") in headers
+    assert b"".join(body) == b'{"detail":"Method Not Allowed"}'
+
+
+@pytest.mark.parametrize(
+    "path, expected_path, expected_path_params",
+    [
+        ("/items/1/", "/items/{id:int}/", {"id": 1}),
+        ("/items/1.5/", "/items/{price:float}/", {"price": 1.5}),
+        (
+            "/items/0b6e4d1c-8c1a-4b1e-9f5e-2f4d3c2b1a00/",
+            "/items/{item_id:uuid}/",
+            {"item_id": UUID("0b6e4d1c-8c1a-4b1e-9f5e-2f4d3c2b1a00")},
+        ),
+        ("/items/apple/", "/items/{slug:str}/", {"slug": "apple"}),
+        ("/files/a/", "/files/{rest:path}/", {"rest": "a"}),
+        ("/files/a/b/c.txt/", "/files/{rest:path}/", {"rest": "a/b/c.txt"}),
+        (
+            "/raw/a/b/c.txt/download/",
+            "/raw/{rest:path}/download/",
+            {"rest": "a/b/c.txt"},
+        ),
+    ],
+)
+def test_route_tree_lookup_with_converters(
+    app: Application,
+    path: str,
+    expected_path: str,
+    expected_path_params: dict[str, Any],
+) -> None:
+    for route_path in [
+        "/items/{id:int}/",
+        "/items/{price:float}/",
+        "/items/{item_id:uuid}/",
+        "/items/{slug:str}/",
+        "/files/{rest:path}/",
+        "/raw/{rest:path}/download/",
+    ]:
+        app.get(route_path)(lambda: None)
+    tree = app.route_tree
+
+    match = tree.lookup(HTTPMethod.GET, path)
+
+    assert match is not None
+    assert match.path == expected_path
+    assert match.path_params == expected_path_params
+
+
+@pytest.mark.parametrize("path", ["/items/one/", "/items/-1/", "/files/"])
+def test_route_tree_lookup_with_converters_not_found(
+    app: Application, path: str
+) -> None:
+    app.get("/items/{id:int}/")(lambda: None)
+    app.get("/files/{rest:path}/")(lambda: None)
+    tree = app.route_tree
+
+    assert tree.lookup(HTTPMethod.GET, path) is None
+
+
+def test_url_path_with_converter(app: Application) -> None:
+    @app.get("/items/{id:int}/")
+    def items():
+        assert False  # noqa: B011
+
+    assert app.url_path_for("items", id=1) == "/items/1/"
+
+
+def test_compile_route_plan(app: Application) -> None:
+    def outer_middleware(call_next: CallNext, data: dict[str, Any]) -> Any:
+        return call_next(data)
+
+    def middleware1(call_next: CallNext, data: dict[str, Any]) -> Any:
+        return call_next(data)
+
+    def middleware2(call_next: CallNext, data: dict[str, Any]) -> Any:
+        return call_next(data)
+
+    router = Router(default_response_class=PlainTextResponse)
+    app.include_router(router)
+    app.outer_middleware(outer_middleware)
+    app.middleware(middleware1)
+    router.middleware(middleware2)
+    router.get("/")(lambda: None)
+
+    app.compile()
+
+    match = app.route_tree.lookup(HTTPMethod.GET, "/")
+    assert match is not None
+    (plan,) = match.candidates
+    assert plan.router is router
+    assert plan.root_filters == (app.route._route, router.route._route)
+    assert plan.outer_middlewares[-1] is outer_middleware
+    assert plan.middlewares == (middleware1, middleware2)
+    assert plan.response_class is PlainTextResponse
+
+
+def test_route_plan_invalidated_on_register_middleware(
+    app: Application,
+) -> None:
+    def middleware(call_next: CallNext, data: dict[str, Any]) -> Any:
+        return call_next(data)
+
+    app.get("/")(lambda: None)
+    app.compile()
+
+    app.middleware(middleware)
+
+    match = app.route_tree.lookup(HTTPMethod.GET, "/")
+    assert match is not None
+    assert match.candidates[0].middlewares == (middleware,)
+
+
+def test_compile_params_resolvers() -> None:
+    def index(id: Annotated[int, Path()], q: Annotated[str, Query()]) -> None:
+        pass
+
+    route = Route(
+        callback=index, path="/{id}/", method=HTTPMethod.GET, name="index"
+    )
+
+    assert route.params_resolvers == (
+        _resolve_path_params,
+        _resolve_query_params,
+    )
+
+
+def test_model_fields() -> None:
+    def index(
+        id: Annotated[int, Path()], q: Annotated[str, Query()] = ""
+    ) -> None:
+        pass
+
+    route = Route(
+        callback=index, path="/{id}/", method=HTTPMethod.GET, name="index"
+    )
+
+    assert route.model_fields == ("id", "q")
+
+
+def test_compile_params_resolvers_without_params(route: Route) -> None:
+    assert route.params_resolvers == ()
+
+
+def test_resolve_params_picks_declared_names_only(
+    mocked_request: Mock,
+) -> None:
+    def index(
+        q: Annotated[str, Query()],
+        token: Annotated[str, Header()],
+        session: Annotated[str, Cookie()],
+    ) -> None:
+        pass
+
+    route = Route(callback=index, path="/", method=HTTPMethod.GET, name="a")
+    mocked_request.query_params = {"q": "search", "page": "1"}
+    mocked_request.headers = CIMultiDict({"Token": "abc", "Host": "test"})
+    mocked_request.cookies = {"session": "id", "theme": "dark"}
+
+    params = resolve_params(route, mocked_request)
+
+    assert params == {"q": "search", "token": "abc", "session": "id"}
+
+
+def _no_params() -> None:
+    pass
+
+
+def _converted_path_params(
+    id: Annotated[int, Path()], token: Annotated[UUID, Path()]
+) -> None:
+    pass
+
+
+def _unconverted_path_param(id: Annotated[int, Path()]) -> None:
+    pass
+
+
+def _constrained_path_param(id: Annotated[int, Path(), Gt(0)]) -> None:
+    pass
+
+
+def _query_param(q: Annotated[str, Query()]) -> None:
+    pass
+
+
+@pytest.mark.parametrize(
+    "callback, path, expected",
+    [
+        (_no_params, "/", True),
+        (_converted_path_params, "/{id:int}/{token:uuid}/", True),
+        (_unconverted_path_param, "/{id}/", False),
+        (_constrained_path_param, "/{id:int}/", False),
+        (_query_param, "/", False),
+    ],
+)
+def test_skip_request_validation(
+    callback: Callable[..., None], path: str, expected: bool
+) -> None:
+    route = Route(
+        callback=callback, path=path, method=HTTPMethod.GET, name="a"
+    )
+
+    assert route.skip_request_validation is expected
+
+
+def test_route_without_params_skips_validator(mocked_request: Mock) -> None:
+    validator = Mock(wraps=PydanticValidator())
+    app = Application(validator=validator)
+    mocked_request.path = "/1/"
+    mocked_request.path_params = {"id": 1}
+
+    @app.get("/{id:int}/")
+    def index(id: Annotated[int, Path()]) -> Any:
+        return id
+
+    response = app.propagate(mocked_request)
+
+    assert response.content == 1
+    validator.validate_request.assert_not_called()
+
+
+def test_constrained_path_param_is_validated(mocked_request: Mock) -> None:
+    app = Application()
+    mocked_request.path = "/0/"
+    mocked_request.path_params = {"id": 0}
+
+    @app.get("/{id:int}/")
+    def index(id: Annotated[int, Path(), Gt(0)]) -> Any:
+        return id
+
+    response = app.propagate(mocked_request)
+
+    assert response.status_code == 422
+    assert response.content["detail"][0]["type"] == "greater_than"
+
+
+def _returns_nothing():
+    pass
+
+
+def _returns_response() -> PlainTextResponse:
+    return PlainTextResponse("")
+
+
+def _returns_bytes() -> bytes:
+    return b""
+
+
+def _returns_int() -> int:
+    return 0
+
+
+@pytest.mark.parametrize(
+    "callback, response_model, expected_strategy",
+    [
+        (_returns_nothing, None, ResponseStrategy.ANY),
+        (_returns_response, None, ResponseStrategy.RESPONSE),
+        (_returns_bytes, None, ResponseStrategy.BYTES),
+        (_returns_int, None, ResponseStrategy.MODEL),
+        (_returns_nothing, int, ResponseStrategy.MODEL),
+        (_returns_int, Response, ResponseStrategy.RESPONSE),
+    ],
+)
+def test_response_strategy(
+    callback: Callable[..., Any],
+    response_model: type | None,
+    expected_strategy: ResponseStrategy,
+) -> None:
+    route = Route(
+        callback=callback,
+        path="/",
+        method=HTTPMethod.GET,
+        name="a",
+        response_model=response_model,
+    )
+
+    assert route.response_strategy is expected_strategy
+
+
+def test_bytes_response_is_served_as_is(mocked_request: Mock) -> None:
+    validator = Mock(wraps=PydanticValidator())
+    app = Application(validator=validator)
+
+    @app.get("/")
+    def index() -> bytes:
+        return b'{"name":"John"}'
+
+    response = app.propagate(mocked_request)
+
+    assert response.render() == b'{"name":"John"}'
+    validator.validate_response.assert_not_called()
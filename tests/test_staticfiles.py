@@ -1,13 +1,21 @@
+import os
 import re
 from pathlib import Path
+from typing import Any
 from unittest.mock import Mock, create_autospec
+from wsgiref.util import FileWrapper
 
 import pytest
 
 from mini_framework import Request, Application
+from mini_framework.middlewares.base import CallNext
 from mini_framework.responses import FileResponse
-from mini_framework.staticfiles import is_not_modified
-from mini_framework.router import NOT_FOUND_RESPONSE
+from mini_framework.staticfiles import (
+    MAX_RANGES,
+    StaticFilesCache,
+    is_not_modified,
+    parse_range_header,
+)
 
 
 def test_create_staticfiles_with_existing_directory(
@@ -115,4 +123,366 @@ def test_callback_file_not_found(
 
     response = app.propagate(mocked_request)
 
-    assert response is NOT_FOUND_RESPONSE
+    assert response.status_code == 404
+    assert response.content == {"detail": "Not Found"}
+
+
+def test_callback_nested_file_found(
+    app: Application, mocked_request: Mock, tmp_path: Path
+) -> None:
+    path = "css/styles.css"
+    directory = tmp_path / "directory"
+    (directory / "css").mkdir(parents=True)
+    file = directory / path
+    file.touch()
+    app.add_staticfiles("/static/", directory)
+    mocked_request.path = f"/static/{path}/"
+    mocked_request.path_params = {"path": path}
+    mocked_request.headers = {}
+
+    response = app.propagate(mocked_request)
+
+    assert isinstance(response, FileResponse)
+    assert response.path == file
+
+
+def test_callback_file_outside_directory(
+    app: Application, mocked_request: Mock, tmp_path: Path
+) -> None:
+    directory = tmp_path / "directory"
+    directory.mkdir()
+    (tmp_path / "secret.txt").touch()
+    app.add_staticfiles("/static/", directory)
+    mocked_request.path = "/static/../secret.txt/"
+    mocked_request.path_params = {"path": "../secret.txt"}
+
+    response = app.propagate(mocked_request)
+
+    assert response.status_code == 404
+    assert response.content == {"detail": "Not Found"}
+
+
+@pytest.mark.parametrize(
+    "range_header, size, expected_ranges",
+    [
+        ("bytes=0-4", 13, [(0, 5)]),
+        ("bytes=7-", 13, [(7, 13)]),
+        ("bytes=-6", 13, [(7, 13)]),
+        ("bytes=-20", 13, [(0, 13)]),
+        ("bytes=0-100", 13, [(0, 13)]),
+        ("bytes=0-1, 7-8", 13, [(0, 2), (7, 9)]),
+        ("bytes=7-8, 0-1", 13, [(0, 2), (7, 9)]),
+        ("bytes=0-4, 3-8, 9-9", 13, [(0, 10)]),
+        ("bytes=13-", 13, []),
+        ("bytes=-0", 13, []),
+        ("bytes=0-", 0, []),
+        ("bytes=5-4", 13, None),
+        ("bytes=a-b", 13, None),
+        ("bytes=-", 13, None),
+        ("items=0-4", 13, None),
+        ("bytes=" + ",".join(["0-0"] * MAX_RANGES), 13, [(0, 1)]),
+        ("bytes=" + ",".join(["0-0"] * (MAX_RANGES + 1)), 13, None),
+    ],
+)
+def test_parse_range_header(
+    range_header: str,
+    size: int,
+    expected_ranges: list[tuple[int, int]] | None,
+) -> None:
+    assert parse_range_header(range_header, size) == expected_ranges
+
+
+@pytest.fixture()
+def static_app(tmp_path: Path) -> Application:
+    directory = tmp_path / "directory"
+    directory.mkdir()
+    (directory / "file.txt").write_bytes(b"Hello, World!")
+    app = Application()
+    app.add_staticfiles("/static/", directory)
+    return app
+
+
+def _get(
+    app: Application,
+    headers: dict[str, str],
+    environ: dict[str, Any] | None = None,
+) -> tuple[str, dict[str, str], bytes]:
+    start_response = Mock()
+    wsgi_environ = {
+        "PATH_INFO": "/static/file.txt",
+        "REQUEST_METHOD": "GET",
+        **(environ or {}),
+    }
+    for name, value in headers.items():
+        wsgi_environ["HTTP_" + name.upper().replace("-", "_")] = value
+    body = b"".join(app(wsgi_environ, start_response))
+    status, raw_headers = start_response.call_args.args
+    return status, dict(raw_headers), body
+
+
+def test_single_range(static_app: Application) -> None:
+    status, headers, body = _get(static_app, {"Range": "bytes=0-4"})
+
+    assert status == "206 Partial Content"
+    assert headers["Content-Range"] == "bytes 0-4/13"
+    assert headers["Content-Length"] == "5"
+    assert headers["Accept-Ranges"] == "bytes"
+    assert body == b"Hello"
+
+
+def test_single_range_with_file_wrapper(static_app: Application) -> None:
+    status, headers, body = _get(
+        static_app,
+        {"Range": "bytes=7-"},
+        {"wsgi.file_wrapper": FileWrapper},
+    )
+
+    assert status == "206 Partial Content"
+    assert headers["Content-Range"] == "bytes 7-12/13"
+    assert body == b"World!"
+
+
+def test_multiple_ranges(static_app: Application) -> None:
+    status, headers, body = _get(static_app, {"Range": "bytes=0-4, 7-11"})
+
+    assert status == "206 Partial Content"
+    content_type, _, boundary = headers["Content-Type"].partition(
+        "; boundary="
+    )
+    assert content_type == "multipart/byteranges"
+    assert int(headers["Content-Length"]) == len(body)
+    assert (
+        body
+        == (
+            f"--{boundary}\r\n"
+            "Content-Type: text/plain; charset=utf-8\r\n"
+            "Content-Range: bytes 0-4/13\r\n\r\n"
+            "Hello\r\n"
+            f"--{boundary}\r\n"
+            "Content-Type: text/plain; charset=utf-8\r\n"
+            "Content-Range: bytes 7-11/13\r\n\r\n"
+            "World\r\n"
+            f"--{boundary}--\r\n"
+        ).encode()
+    )
+
+
+def test_too_many_ranges(static_app: Application) -> None:
+    status, _, body = _get(
+        static_app, {"Range": "bytes=" + ",".join(["0-0"] * (MAX_RANGES + 1))}
+    )
+
+    assert status == "200 OK"
+    assert body == b"Hello, World!"
+
+
+def test_range_not_satisfiable(static_app: Application) -> None:
+    status, headers, body = _get(static_app, {"Range": "bytes=20-"})
+
+    assert status == "416 Requested Range Not Satisfiable"
+    assert headers["Content-Range"] == "bytes */13"
+    assert body == b""
+
+
+@pytest.mark.parametrize(
+    "if_range, expected_status",
+    [
+        ("etag", "206 Partial Content"),
+        ("last-modified", "206 Partial Content"),
+        ('"outdated"', "200 OK"),
+        ("Thu, 01 Jan 1970 00:00:00 GMT", "200 OK"),
+    ],
+)
+def test_if_range(
+    static_app: Application, if_range: str, expected_status: str
+) -> None:
+    _, headers, _ = _get(static_app, {})
+    if_range = headers.get(if_range.title(), if_range)
+
+    status, _, body = _get(
+        static_app, {"Range": "bytes=0-4", "If-Range": if_range}
+    )
+
+    assert status == expected_status
+    assert body == (
+        b"Hello"
+        if expected_status == "206 Partial Content"
+        else b"Hello, World!"
+    )
+
+
+def _add_frame_options_middleware(app: Application) -> None:
+    @app.route.middleware
+    def middleware(call_next: CallNext, data: dict[str, Any]) -> Any:
+        response = call_next(data)
+        response.headers["X-Frame-Options"] = "DENY"
+        return response
+
+
+@pytest.mark.parametrize(
+    "path, expected_status",
+    [
+        ("/static/file.txt", "304 Not Modified"),
+        ("/static/missing.txt", "404 Not Found"),
+    ],
+)
+def test_middleware_modifies_static_response(
+    static_app: Application, path: str, expected_status: str
+) -> None:
+    _add_frame_options_middleware(static_app)
+    _, headers, _ = _get(static_app, {})
+    etag = headers["Etag"]
+
+    for _ in range(2):
+        status, headers, _ = _get(
+            static_app,
+            {"If-None-Match": etag},
+            {"PATH_INFO": path},
+        )
+
+        assert status == expected_status
+        assert headers["X-Frame-Options"] == "DENY"
+
+
+@pytest.fixture()
+def cache() -> StaticFilesCache:
+    return StaticFilesCache(max_size=30, max_file_size=20, stat_interval=0)
+
+
+@pytest.fixture()
+def cached_static_app(tmp_path: Path, cache: StaticFilesCache) -> Application:
+    directory = tmp_path / "directory"
+    directory.mkdir()
+    (directory / "file.txt").write_bytes(b"Hello, World!")
+    app = Application()
+    app.add_staticfiles("/static/", directory, cache=cache)
+    return app
+
+
+def test_cache_hit(
+    cached_static_app: Application, cache: StaticFilesCache
+) -> None:
+    first = _get(cached_static_app, {})
+    second = _get(cached_static_app, {})
+
+    assert first == second
+    assert second[0] == "200 OK"
+    assert second[2] == b"Hello, World!"
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+
+
+def test_cache_hit_through_middleware(
+    cached_static_app: Application, cache: StaticFilesCache
+) -> None:
+    _add_frame_options_middleware(cached_static_app)
+
+    for _ in range(2):
+        status, headers, body = _get(cached_static_app, {})
+
+        assert status == "200 OK"
+        assert headers["X-Frame-Options"] == "DENY"
+        assert headers["Content-Length"] == "13"
+        assert body == b"Hello, World!"
+    assert cache.hits == 1
+
+
+def test_cache_not_modified(
+    cached_static_app: Application, cache: StaticFilesCache
+) -> None:
+    _, headers, _ = _get(cached_static_app, {})
+
+    status, _, _ = _get(cached_static_app, {"If-None-Match": headers["Etag"]})
+
+    assert status == "304 Not Modified"
+    assert cache.hits == 1
+
+
+def test_cache_bypassed_for_range(
+    cached_static_app: Application, cache: StaticFilesCache
+) -> None:
+    _get(cached_static_app, {})
+
+    status, _, body = _get(cached_static_app, {"Range": "bytes=0-4"})
+
+    assert status == "206 Partial Content"
+    assert body == b"Hello"
+    assert cache.hits == 0
+
+
+def test_cache_not_filled_by_range(
+    cached_static_app: Application, cache: StaticFilesCache
+) -> None:
+    status, _, _ = _get(cached_static_app, {"Range": "bytes=0-4"})
+
+    assert status == "206 Partial Content"
+    assert len(cache) == 0
+
+
+def test_cache_revalidates_changed_file(
+    cached_static_app: Application, cache: StaticFilesCache, tmp_path: Path
+) -> None:
+    _get(cached_static_app, {})
+    file = tmp_path / "directory" / "file.txt"
+    file.write_bytes(b"Bye, World!")
+    os.utime(file, ns=(0, 0))
+
+    _, _, body = _get(cached_static_app, {})
+
+    assert body == b"Bye, World!"
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_cache_skips_stat_within_interval(
+    cached_static_app: Application, cache: StaticFilesCache, tmp_path: Path
+) -> None:
+    cache.stat_interval = 60
+    _get(cached_static_app, {})
+    (tmp_path / "directory" / "file.txt").unlink()
+
+    status, _, body = _get(cached_static_app, {})
+
+    assert status == "200 OK"
+    assert body == b"Hello, World!"
+
+
+def test_cache_shared_between_mounts(
+    tmp_path: Path, cache: StaticFilesCache
+) -> None:
+    app = Application()
+    for name in ("first", "second"):
+        directory = tmp_path / name
+        directory.mkdir()
+        (directory / "file.txt").write_text(name)
+        app.add_staticfiles(f"/{name}/", directory, name=name, cache=cache)
+
+    for name in ("first", "second", "first", "second"):
+        _, _, body = _get(app, {}, {"PATH_INFO": f"/{name}/file.txt"})
+
+        assert body == name.encode()
+    assert (cache.hits, len(cache)) == (2, 2)
+
+
+def test_cache_evicts_least_recently_used(
+    cache: StaticFilesCache, tmp_path: Path
+) -> None:
+    for name in ("a", "b", "c"):
+        (tmp_path / name).write_bytes(b"0123456789")
+        cache.put(FileResponse(tmp_path / name))
+    cache.get(tmp_path / "a")
+    (tmp_path / "d").write_bytes(b"0123456789")
+
+    cache.put(FileResponse(tmp_path / "d"))
+
+    assert cache.get(tmp_path / "b") is None
+    assert cache.get(tmp_path / "a") is not None
+    assert (cache.size, cache.evictions) == (30, 1)
+
+
+def test_cache_skips_large_files(
+    cache: StaticFilesCache, tmp_path: Path
+) -> None:
+    (tmp_path / "large").write_bytes(b"0" * 21)
+
+    cache.put(FileResponse(tmp_path / "large"))
+
+    assert len(cache) == 0
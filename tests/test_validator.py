@@ -1,8 +1,12 @@
+import json
+from collections.abc import Callable
 from dataclasses import dataclass
+from io import BytesIO
 from typing import Annotated, Any
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
+from annotated_types import Gt
 
 from mini_framework import Application
 from mini_framework.datastructures import FormData
@@ -18,6 +22,8 @@ from mini_framework.params import (
     Param,
     BodyModel,
 )
+from mini_framework.validators.base import Validator
+from mini_framework.validators.pydantic import PydanticValidator, _get_adapter
 
 
 @pytest.mark.parametrize(
@@ -63,8 +69,7 @@ def test_missing_params(
 def test_missing_body_model_param(
     app: Application, mocked_request: Mock
 ) -> None:
-    mocked_request.body_models = {}
-    mocked_request.json.return_value = {}
+    mocked_request.body = b"{}"
 
     @dataclass(frozen=True, slots=True, kw_only=True)
     class Model:
@@ -142,3 +147,385 @@ def test_validation_error(app: Application, mocked_request: Mock) -> None:
 
     assert exc_info.value.value == "World"
     assert exc_info.value.expected_type is int
+
+
+def test_response_validation_off(mocked_request: Mock) -> None:
+    app = Application(response_validation_rate=0)
+
+    @app.get("/")
+    def index() -> int:
+        return "World"  # type: ignore[return-value]
+
+    response = app.propagate(mocked_request)
+
+    assert response.content == "World"
+
+
+def test_route_response_validation_rate_overrides_app(
+    mocked_request: Mock,
+) -> None:
+    app = Application(response_validation_rate=0)
+
+    @app.get("/", response_validation_rate=1)
+    def index() -> int:
+        return "World"  # type: ignore[return-value]
+
+    with pytest.raises(ResponseValidationError):
+        app.propagate(mocked_request)
+
+
+@pytest.mark.parametrize(
+    "random_value, expected_failures", [(0.05, 1), (0.5, 0)]
+)
+def test_sampled_response_validation(
+    app: Application,
+    mocked_request: Mock,
+    random_value: float,
+    expected_failures: int,
+) -> None:
+    @app.get("/", response_validation_rate=0.1)
+    def index() -> int:
+        return "World"  # type: ignore[return-value]
+
+    (route,) = app.route
+
+    with patch(
+        "mini_framework.routes.manager.random", return_value=random_value
+    ):
+        response = app.propagate(mocked_request)
+
+    assert response.content == "World"
+    assert route.response_validation_failures == expected_failures
+
+
+def test_unsampled_response_model_projection(mocked_request: Mock) -> None:
+    app = Application(response_validation_rate=0)
+
+    @dataclass(frozen=True, slots=True, kw_only=True)
+    class Out:
+        name: str
+
+    @app.get("/", response_model=Out)
+    def index() -> dict[str, str]:
+        return {"name": "bob", "password": "secret"}
+
+    response = app.propagate(mocked_request)
+
+    assert response.content == {"name": "bob"}
+
+
+def test_sampled_response_model_projection_rejected(app: Application) -> None:
+    @dataclass(frozen=True, slots=True, kw_only=True)
+    class Out:
+        name: str
+
+    with pytest.raises(ValueError):
+
+        @app.get("/", response_model=Out, response_validation_rate=0.5)
+        def index() -> dict[str, str]:
+            return {"name": "bob", "password": "secret"}
+
+
+@pytest.mark.parametrize("rate", [-0.1, 1.1])
+def test_invalid_response_validation_rate(
+    app: Application, rate: float
+) -> None:
+    with pytest.raises(ValueError):
+        Application(response_validation_rate=rate)
+
+    with pytest.raises(ValueError):
+        app.get("/", response_validation_rate=rate)(lambda: None)
+
+
+def test_warm_up(app: Application) -> None:
+    @dataclass(frozen=True, slots=True, kw_only=True)
+    class User:
+        name: str
+
+    @app.get("/")
+    def index(name: Annotated[str, Query()]) -> User:
+        return User(name=name)
+
+    (route,) = app.route
+
+    elapsed = app.warm_up()
+
+    assert elapsed >= 0
+    assert hasattr(route.model, "__pydantic_config__")
+    assert hasattr(User, "__pydantic_config__")
+
+
+def test_warm_up_body_model(app: Application) -> None:
+    @dataclass(frozen=True, slots=True, kw_only=True)
+    class User:
+        name: str
+
+    @app.post("/")
+    def index(user: Annotated[User, BodyModel()]) -> None:
+        pass
+
+    (route,) = app.route
+
+    app.warm_up()
+
+    misses = _get_adapter.cache_info().misses
+    _get_adapter(route.body_models["user"])
+    assert _get_adapter.cache_info().misses == misses
+
+
+def test_body_model_param_decoded_from_raw_body(
+    app: Application, mocked_request: Mock
+) -> None:
+    mocked_request.body = b'{"name": "John", "age": 20}'
+
+    @dataclass(frozen=True, slots=True, kw_only=True)
+    class Model:
+        name: str
+        age: int
+
+    @app.get("/")
+    def index(model: Annotated[Model, BodyModel()]) -> Model:
+        return model
+
+    response = app.propagate(mocked_request)
+
+    assert response.content == {"name": "John", "age": 20}
+    mocked_request.json.assert_not_called()
+
+
+def test_body_model_param_invalid_json(
+    app: Application, mocked_request: Mock
+) -> None:
+    mocked_request.body = b"{"
+
+    @dataclass(frozen=True, slots=True, kw_only=True)
+    class Model:
+        name: str
+
+    def index(model: Annotated[Model, BodyModel()]):
+        assert False  # noqa: B011
+
+    app.get("/")(index)
+
+    response = app.propagate(mocked_request)
+
+    assert response.status_code == 422
+    assert response.content["detail"][0]["type"] == "json_invalid"
+    assert response.content["detail"][0]["loc"] == ("model",)
+    assert response.content["detail"][0]["input"] == "{"
+
+
+def test_params_coercer(app: Application, mocked_request: Mock) -> None:
+    mocked_request.path = "/1/"
+    mocked_request.path_params = {"id": "1"}
+    mocked_request.query_params = {
+        "price": "9.5",
+        "active": "yes",
+        "tags": ["1", "2"],
+        "single": ["3"],
+    }
+    mocked_request.headers = {"token": "abc"}
+
+    @app.get("/{id}/")
+    def index(
+        id: Annotated[int, Path()],
+        price: Annotated[float, Query()],
+        active: Annotated[bool, Query()],
+        tags: Annotated[list[int], Query()],
+        single: Annotated[list[int], Query()],
+        token: Annotated[str, Header()],
+        page: Annotated[int | None, Query()] = None,
+    ) -> dict[str, Any]:
+        return {
+            "id": id,
+            "price": price,
+            "active": active,
+            "tags": tags,
+            "single": single,
+            "token": token,
+            "page": page,
+        }
+
+    (route,) = app.route
+
+    response = app.propagate(mocked_request)
+
+    assert route.params_coercer is not None
+    assert response.content == {
+        "id": 1,
+        "price": 9.5,
+        "active": True,
+        "tags": [1, 2],
+        "single": [3],
+        "token": "abc",
+        "page": None,
+    }
+
+
+def test_params_coercer_errors(app: Application, mocked_request: Mock) -> None:
+    mocked_request.query_params = {"age": "twenty", "ids": ["1", "x"]}
+
+    @app.get("/")
+    def index(
+        name: Annotated[str, Query()],
+        age: Annotated[int, Query()],
+        ids: Annotated[list[int], Query()],
+    ):
+        assert False  # noqa: B011
+
+    response = app.propagate(mocked_request)
+
+    assert response.status_code == 422
+    assert response.content == {
+        "detail": [
+            {
+                "type": "missing",
+                "loc": ("name",),
+                "msg": "Field required",
+                "input": {"age": "twenty", "ids": ["1", "x"]},
+            },
+            {
+                "type": "int_parsing",
+                "loc": ("age",),
+                "msg": "Input should be a valid integer, "
+                "unable to parse string as an integer",
+                "input": "twenty",
+            },
+            {
+                "type": "int_parsing",
+                "loc": ("ids", 1),
+                "msg": "Input should be a valid integer, "
+                "unable to parse string as an integer",
+                "input": "x",
+            },
+        ]
+    }
+
+
+@pytest.mark.parametrize(
+    "param_type, value",
+    [
+        (int, "12"),
+        (int, "-0"),
+        (int, "1.0"),
+        (int, "1.5"),
+        (int, " 12 "),
+        (int, "1_000"),
+        (int, "\u0661\u0662"),
+        pytest.param(int, "9" * 5000, id="int-too-many-digits"),
+        (float, "1.5"),
+        (float, "1e3"),
+        (float, ".5"),
+        (float, "inf"),
+        (float, "\u0661"),
+        (bool, "Yes"),
+        (bool, " yes"),
+        (bool, "2"),
+        (list[int], "3"),
+        (list[int], ["1", "1.0"]),
+    ],
+)
+def test_params_coercer_matches_validator(
+    mocked_request: Mock, param_type: Any, value: Any
+) -> None:
+    mocked_request.query_params = {"value": value}
+
+    def propagate(*metadata: Any) -> tuple[int, Any]:
+        app = Application()
+
+        @app.get("/")
+        def index(value: Annotated[param_type, Query(), *metadata]) -> Any:
+            return value
+
+        response = app.propagate(mocked_request)
+        return response.status_code, response.content
+
+    # Any extra metadata makes the route fall back to the validator
+    assert propagate() == propagate("validated")
+
+
+def test_params_coercer_skips_validator(mocked_request: Mock) -> None:
+    validator = Mock(wraps=PydanticValidator())
+    app = Application(validator=validator)
+    mocked_request.query_params = {"page": "2"}
+
+    @app.get("/")
+    def index(page: Annotated[int, Query()]) -> int:
+        return page
+
+    response = app.propagate(mocked_request)
+
+    assert response.content == 2
+    validator.validate_request.assert_not_called()
+
+
+def _body_param(name: Annotated[str, Body()]) -> None:
+    pass
+
+
+def _constrained_param(age: Annotated[int, Query(), Gt(0)]) -> None:
+    pass
+
+
+def _complex_param(tags: Annotated[dict[str, int], Query()]) -> None:
+    pass
+
+
+@pytest.mark.parametrize(
+    "callback", [_body_param, _constrained_param, _complex_param]
+)
+def test_params_coercer_falls_back_to_validator(
+    app: Application, callback: Callable[..., None]
+) -> None:
+    app.get("/")(callback)
+
+    (route,) = app.route
+
+    assert route.params_coercer is None
+
+
+class DefaultBodyValidator(PydanticValidator):
+    validate_request_body = Validator.validate_request_body
+
+
+@pytest.mark.parametrize(
+    "body, expected_status, expected_body",
+    [
+        (b'{"name": "John"}', "200 OK", b'"JOHN"'),
+        (
+            b"{",
+            "422 Unprocessable Entity",
+            b'{"detail":[{"type":"json_invalid","loc":["user"],'
+            b'"msg":"Invalid JSON: Expecting property name enclosed in '
+            b'double quotes: line 1 column 2 (char 1)","input":"{"}]}',
+        ),
+    ],
+)
+def test_default_validate_request_body(
+    body: bytes, expected_status: str, expected_body: bytes
+) -> None:
+    json_loads = Mock(wraps=json.loads)
+    app = Application(validator=DefaultBodyValidator(), json_loads=json_loads)
+
+    @dataclass(frozen=True, slots=True, kw_only=True)
+    class User:
+        name: str
+
+    @app.post("/")
+    def index(user: Annotated[User, BodyModel()]) -> str:
+        return user.name.upper()
+
+    start_response = Mock()
+
+    response_body = app(
+        {
+            "PATH_INFO": "/",
+            "REQUEST_METHOD": "POST",
+            "wsgi.input": BytesIO(body),
+        },
+        start_response,
+    )
+
+    assert start_response.call_args.args[0] == expected_status
+    assert b"".join(response_body) == expected_body
+    json_loads.assert_called_once_with(body)